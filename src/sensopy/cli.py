@@ -0,0 +1,276 @@
+"""Command-line batch evaluator.
+
+Reads test specifications as JSON lines or CSV and writes one JSON line of results
+per specification::
+
+    echo '{"method": "triangle", "x": 25, "n": 50}' | sensopy
+
+Each specification has the fields ``method`` (see `get_method`), ``x`` and ``n``,
+and optionally ``test`` (``difference`` or ``equivalence``, default
+``difference``), ``pd0`` (default 0) and ``conf_level`` (default 0.95). Input is
+processed in batches, so methods are set up once per process and results are
+streamed out as each batch completes. Specifications that cannot be parsed or
+evaluated produce a line with an ``error`` field instead of stopping the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import contextlib
+import csv
+import dataclasses
+import functools
+import itertools
+import json
+import math
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from .discrimination import DiscriminationTest, get_method
+from .discrimination.ingest import JSONL_SUFFIXES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from concurrent.futures import Future
+
+DEFAULT_BATCH_SIZE = 1000
+"""Number of specifications evaluated per batch."""
+
+TESTS = ("difference", "equivalence")
+"""Tests that a specification can request."""
+
+
+@functools.cache
+def _test(method: str) -> DiscriminationTest:
+    return DiscriminationTest(get_method(method))
+
+
+def _finite(value: Any) -> Any:  # noqa: ANN401
+    """Replace non-finite floats, which JSON cannot represent, with ``None``.
+
+    Returns:
+        The value with every NaN or infinity replaced, recursing into dictionaries.
+    """
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _field(spec: dict[str, Any], name: str, default: float) -> float:
+    """Read an optional numeric field, treating a missing or empty value as absent.
+
+    Returns:
+        The value of the field as a float, or `default`.
+    """
+    value = spec.get(name)
+    return default if value is None or value == "" else float(value)
+
+
+def _count(spec: dict[str, Any], name: str) -> int:
+    """Read a required count, rejecting values with a fractional part.
+
+    Returns:
+        The value of the field as an int.
+
+    Raises:
+        ValueError: If the value is not a whole number.
+    """
+    value = float(spec[name])
+    if not value.is_integer():
+        raise ValueError(f"{name} must be a whole number, got {spec[name]}.")
+    return int(value)
+
+
+def _check(x: int, n: int, pd0: float, conf_level: float) -> None:
+    """Check the ranges of the counts, pd0 and the confidence level.
+
+    Raises:
+        ValueError: If n is not positive, x is outside [0, n], pd0 is outside
+            [0, 1) or the confidence level is outside (0, 1).
+    """
+    if n <= 0:
+        raise ValueError(f"n must be positive, got {n}.")
+    if not 0 <= x <= n:
+        raise ValueError(f"x must be between 0 and n, got {x}.")
+    if not 0 <= pd0 < 1:
+        raise ValueError(f"pd0 must be in [0, 1), got {pd0}.")
+    if not 0 < conf_level < 1:
+        raise ValueError(f"conf_level must be between 0 and 1, got {conf_level}.")
+
+
+def evaluate(spec: dict[str, Any]) -> dict[str, Any]:
+    """Evaluate a single test specification.
+
+    Args:
+        spec: The specification, with values as parsed from JSON or CSV. Records
+            that already carry an ``error`` field, such as lines that could not be
+            parsed, are passed through unchanged.
+
+    Returns:
+        The specification followed by the fields of the TestResults, or by an
+        ``error`` field if it could not be evaluated.
+    """
+    if "error" in spec:
+        return spec
+    test = str(spec.get("test") or "difference")
+    if test not in TESTS:
+        return {**spec, "error": f"Unknown test: {test!r}."}
+    try:
+        run = getattr(_test(str(spec["method"])), test)
+        x = _count(spec, "x")
+        n = _count(spec, "n")
+        pd0 = _field(spec, "pd0", 0)
+        conf_level = _field(spec, "conf_level", 0.95)
+        _check(x, n, pd0, conf_level)
+        results = run(x, n, pd0, conf_level)
+    except (KeyError, TypeError, ValueError, ArithmeticError) as error:
+        message = f"Missing field: {error.args[0]}." if isinstance(error, KeyError) else str(error)
+        return {**spec, "error": message}
+    result: dict[str, Any] = _finite({**spec, **dataclasses.asdict(results)})
+    return result
+
+
+def evaluate_batch(specs: Sequence[dict[str, Any]]) -> str:
+    """Evaluate a batch of specifications.
+
+    Args:
+        specs: The specifications.
+
+    Returns:
+        One JSON line per specification, joined and newline-terminated.
+    """
+    return "".join(json.dumps(evaluate(spec)) + "\n" for spec in specs)
+
+
+def read_specs(source: IO[str], file_format: str) -> Iterator[dict[str, Any]]:
+    """Stream test specifications from a text stream.
+
+    Args:
+        source: The input stream.
+        file_format: ``"jsonl"`` or ``"csv"``. CSV files need a header row.
+
+    Yields:
+        One dictionary per specification. Lines that cannot be parsed yield a
+        record with their ``line`` number and an ``error`` field instead.
+    """
+    if file_format == "csv":
+        reader = csv.DictReader(source)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as error:
+                yield {"line": reader.line_num, "error": f"Invalid CSV: {error}."}
+                continue
+            yield dict(row)
+    else:
+        for number, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                spec = json.loads(line)
+            except json.JSONDecodeError as error:
+                yield {"line": number, "error": f"Invalid JSON: {error}."}
+                continue
+            if isinstance(spec, dict):
+                yield spec
+            else:
+                yield {"line": number, "error": "Invalid JSON: expected an object."}
+
+
+def run(
+    specs: Iterable[dict[str, Any]],
+    output: IO[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = 1,
+) -> None:
+    """Evaluate specifications in batches and stream the results in input order.
+
+    Args:
+        specs: The specifications.
+        output: Stream receiving one JSON line per specification.
+        batch_size: Number of specifications per batch.
+        workers: Number of worker processes. With more than one, up to two
+            batches per worker are in flight at a time, which bounds memory use.
+    """
+    iterator = iter(specs)
+    batches = iter(lambda: list(itertools.islice(iterator, batch_size)), [])
+    if workers <= 1:
+        for batch in batches:
+            output.write(evaluate_batch(batch))
+            output.flush()
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending: collections.deque[Future[str]] = collections.deque()
+        for batch in batches:
+            pending.append(executor.submit(evaluate_batch, batch))
+            if len(pending) >= 2 * workers:
+                output.write(pending.popleft().result())
+                output.flush()
+        while pending:
+            output.write(pending.popleft().result())
+            output.flush()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entry point of the ``sensopy`` command.
+
+    Args:
+        argv: Command-line arguments (default: ``sys.argv[1:]``).
+    """
+    parser = argparse.ArgumentParser(
+        prog="sensopy",
+        description="Evaluate discrimination tests from JSON-lines or CSV specifications.",
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="input file (default: standard input)",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="output file (default: standard output)"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("jsonl", "csv"),
+        help="input format (default: from the file suffix, JSON lines for standard input)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        default=DEFAULT_BATCH_SIZE,
+        type=int,
+        help="specifications per batch",
+    )
+    parser.add_argument("-j", "--workers", default=1, type=int, help="worker processes")
+    args = parser.parse_args(argv)
+
+    file_format = args.format
+    if file_format is None:
+        is_csv = args.input != "-" and Path(args.input).suffix not in JSONL_SUFFIXES
+        file_format = "csv" if is_csv else "jsonl"
+
+    with (
+        _open(args.input, "r") as source,
+        _open(args.output, "w") as output,
+    ):
+        run(read_specs(source, file_format), output, args.batch_size, args.workers)
+
+
+def _open(path: str, mode: str) -> contextlib.AbstractContextManager[IO[str]]:
+    if path == "-":
+        # Leave the standard streams open when the with block exits.
+        return contextlib.nullcontext(sys.stdin if mode == "r" else sys.stdout)
+    return Path(path).open(mode, encoding="utf-8", newline="")
+
+
+if __name__ == "__main__":
+    main()
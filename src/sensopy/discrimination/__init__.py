@@ -2,16 +2,36 @@
 
 from __future__ import annotations
 
-from .discrimination import DiscriminationTest, Statistic, TestResults
+from .batch import load_batch, run_batch
+from .bayes import BayesianResults, BayesianTest
+from .cache import CacheInfo, ResultCache
+from .comparison import (
+    DPrimeDifference,
+    HomogeneityResults,
+    compare_d_primes,
+    estimate_d_primes,
+    homogeneity_test,
+    pairwise_comparisons,
+)
+from .discrimination import Analysis, DiscriminationTest, Statistic, TestResults, TostResults
+from .dod import DegreeOfDifferenceTest, DODResults
+from .double import DoubleDiscriminationTest, DoubleResults
+from .ingest import TrialCounter, TrialCounts, count_trials, read_chunks
 from .methods import (
+    DOUBLE_DUO_TRIO,
+    DOUBLE_THREE_AFC,
+    DOUBLE_TRIANGLE,
+    DOUBLE_TWO_AFC,
     DUAL_PAIR,
     DUO_TRIO,
     FOUR_AFC,
+    METHODS,
     SPECIFIED_TETRAD,
     THREE_AFC,
     TRIANGLE,
     TWO_AFC,
     UNSPECIFIED_TETRAD,
+    DoubleMethod,
     DualPairMethod,
     DuoTrioMethod,
     FourAFCMethod,
@@ -22,28 +42,94 @@ from .methods import (
     TriangleMethod,
     TwoAFCMethod,
     UnspecifiedTetrad,
+    get_method,
+    get_tolerance,
+    set_tolerance,
+)
+from .multiple import MultipleSampleResults, MultipleSampleTest, holm
+from .response_bias import (
+    A_NOT_A,
+    A_NOT_AR,
+    SAME_DIFFERENT,
+    ANotAMethod,
+    ANotARMethod,
+    ResponseBiasMethod,
+    ResponseBiasResults,
+    SameDifferentMethod,
 )
+from .rindex import RIndexResults, RIndexTest
+from .roc import ROCAccumulator, ROCResults, auc_to_d_prime, d_prime_to_auc
+from .tables import PsychometricTable
 
 __all__ = [
+    "A_NOT_A",
+    "A_NOT_AR",
+    "DOUBLE_DUO_TRIO",
+    "DOUBLE_THREE_AFC",
+    "DOUBLE_TRIANGLE",
+    "DOUBLE_TWO_AFC",
     "DUAL_PAIR",
     "DUO_TRIO",
     "FOUR_AFC",
+    "METHODS",
+    "SAME_DIFFERENT",
     "SPECIFIED_TETRAD",
     "THREE_AFC",
     "TRIANGLE",
     "TWO_AFC",
     "UNSPECIFIED_TETRAD",
+    "ANotAMethod",
+    "ANotARMethod",
+    "Analysis",
+    "BayesianResults",
+    "BayesianTest",
+    "CacheInfo",
+    "DODResults",
+    "DPrimeDifference",
+    "DegreeOfDifferenceTest",
     "DiscriminationTest",
+    "DoubleDiscriminationTest",
+    "DoubleMethod",
+    "DoubleResults",
     "DualPairMethod",
     "DuoTrioMethod",
     "FourAFCMethod",
+    "HomogeneityResults",
     "MPlusNMethod",
     "MultipleAFCMethod",
+    "MultipleSampleResults",
+    "MultipleSampleTest",
+    "PsychometricTable",
+    "RIndexResults",
+    "RIndexTest",
+    "ROCAccumulator",
+    "ROCResults",
+    "ResponseBiasMethod",
+    "ResponseBiasResults",
+    "ResultCache",
+    "SameDifferentMethod",
     "SpecifiedTetradMethod",
     "Statistic",
     "TestResults",
     "ThreeAFCMethod",
+    "TostResults",
+    "TrialCounter",
+    "TrialCounts",
     "TriangleMethod",
     "TwoAFCMethod",
     "UnspecifiedTetrad",
+    "auc_to_d_prime",
+    "compare_d_primes",
+    "count_trials",
+    "d_prime_to_auc",
+    "estimate_d_primes",
+    "get_method",
+    "get_tolerance",
+    "holm",
+    "homogeneity_test",
+    "load_batch",
+    "pairwise_comparisons",
+    "read_chunks",
+    "run_batch",
+    "set_tolerance",
 ]
@@ -0,0 +1,65 @@
+"""Numerical helpers shared by the discrimination modules."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy.stats import chi2
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+SQRT2 = math.sqrt(2)
+
+
+def pdf(x: float) -> float:
+    """Standard normal density of a scalar, for quadrature integrands.
+
+    Returns:
+        φ(x).
+    """
+    return math.exp(-x * x / 2) / math.sqrt(2 * math.pi)
+
+
+def cdf(x: float) -> float:
+    """Standard normal distribution function of a scalar, for quadrature integrands.
+
+    Returns:
+        Φ(x).
+    """
+    return math.erfc(-x / SQRT2) / 2
+
+
+def phi(x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Standard normal density, elementwise.
+
+    Returns:
+        φ(x) for every element of `x`.
+    """
+    density: npt.NDArray[np.float64] = np.exp(-(x**2) / 2) / np.sqrt(2 * np.pi)
+    return density
+
+
+def xlogy(x: npt.NDArray[np.float64], y: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Compute x·log(y) with the convention 0·log(0) = 0, as in log-likelihoods.
+
+    Returns:
+        x·log(y) elementwise, zero where `x` is zero.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(x > 0, x * np.log(y), 0.0)
+
+
+def boundary_p_value(statistic: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """P-value of a likelihood-ratio test of a parameter on its boundary.
+
+    When the null value, such as d' = 0, lies on the boundary of the parameter
+    space, the LR statistic follows a 50:50 mixture of χ²_0 and χ²_1 under H0.
+
+    Returns:
+        The p-value for each statistic; one where the statistic is zero.
+    """
+    p_value: npt.NDArray[np.float64] = np.where(statistic > 0, chi2.sf(statistic, 1) / 2, 1.0)
+    return p_value
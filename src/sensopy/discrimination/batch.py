@@ -0,0 +1,200 @@
+"""Checkpointed, resumable batch runs with memory-mapped columnar output.
+
+Each field of `TestResults` is written to its own ``.npy`` file in the output
+directory, with one entry per input row; `Statistic` fields are flattened into one
+column per attribute, such as ``d_prime_lower``, and an ``error`` column flags rows
+that could not be evaluated. The columns are preallocated with
+`np.lib.format.open_memmap`, so they can be read back with `np.load` at any time,
+and a checkpoint file records how many rows are complete. Rerunning the same batch
+on the same directory resumes after the last checkpoint.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import typing
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .discrimination import DiscriminationTest, Statistic, TestResults
+from .methods import get_method
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    import numpy.typing as npt
+
+CHECKPOINT = "checkpoint.json"
+"""Name of the checkpoint file in the output directory."""
+
+_HINTS = typing.get_type_hints(TestResults)
+
+COLUMNS: tuple[str, ...] = (
+    *(
+        f"{field.name}_{attribute.name}" if _HINTS[field.name] is Statistic else field.name
+        for field in dataclasses.fields(TestResults)
+        for attribute in (
+            dataclasses.fields(Statistic) if _HINTS[field.name] is Statistic else [field]
+        )
+    ),
+    "error",
+)
+"""Output columns, mirroring the fields of `TestResults` and `Statistic`, followed by
+an ``error`` flag that is 1 for rows that could not be evaluated."""
+
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+"""Rows computed between checkpoints."""
+
+
+def _row(results: TestResults) -> list[float]:
+    values: list[float] = []
+    for field in dataclasses.fields(results):
+        value = getattr(results, field.name)
+        values.extend(dataclasses.astuple(value) if isinstance(value, Statistic) else [value])
+    return [*values, 0.0]
+
+
+_FAILED = [np.nan] * (len(COLUMNS) - 1) + [1.0]
+"""Row written when a test cannot be evaluated."""
+
+
+def _evaluate(
+    run: Callable[[int, int, float, float], TestResults],
+    x: int,
+    n: int,
+    pd0: float,
+    conf_level: float,
+) -> list[float]:
+    if n <= 0 or not 0 <= x <= n:
+        return _FAILED
+    try:
+        return _row(run(x, n, pd0, conf_level))
+    except (ValueError, ArithmeticError):
+        return _FAILED
+
+
+def _fingerprint(
+    methods: npt.NDArray[np.str_],
+    x: npt.NDArray[np.int64],
+    n: npt.NDArray[np.int64],
+    pd0: npt.NDArray[np.float64],
+    test: str,
+    conf_level: float,
+) -> str:
+    digest = hashlib.sha256(f"{test}:{conf_level!r}".encode())
+    for array in (methods, x, n, pd0):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+def _write_checkpoint(directory: Path, state: dict[str, object]) -> None:
+    path = directory / CHECKPOINT
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(state))
+    os.replace(temporary, path)
+
+
+def run_batch(
+    directory: str | Path,
+    method: str | Sequence[str],
+    x: npt.ArrayLike,
+    n: npt.ArrayLike,
+    pd0: npt.ArrayLike = 0,
+    *,
+    test: str = "difference",
+    conf_level: float = 0.95,
+    checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+) -> dict[str, npt.NDArray[np.float64]]:
+    """Run a test over many rows, writing results to memory-mapped columns.
+
+    Rows are processed in order. Every `checkpoint_interval` rows the columns are
+    flushed to disk and the checkpoint is updated, so at most that many rows are
+    recomputed after an interruption. Calling the function again with the same
+    inputs and directory resumes after the last checkpoint; a completed batch
+    returns immediately. Rows that cannot be evaluated, such as rows with no
+    trials or more correct responses than trials, are written as NaN with the
+    ``error`` column set to 1, so a bad row does not stop the batch.
+
+    Args:
+        directory: Output directory, created if needed.
+        method: Method name for all rows, or one name per row (see `get_method`).
+        x: Numbers of correct responses, one per row.
+        n: Numbers of trials; broadcast against `x`.
+        pd0: Threshold proportions of discriminators; broadcast against `x`.
+        test: ``"difference"`` or ``"equivalence"``.
+        conf_level: Confidence level for the interval estimates.
+        checkpoint_interval: Rows computed between checkpoints.
+
+    Returns:
+        The result columns, memory-mapped read-only (see `load_batch`).
+
+    Raises:
+        ValueError: If the test or a method is unknown, or the directory holds a
+            batch with different inputs.
+    """
+    if test not in {"difference", "equivalence"}:
+        raise ValueError(f"Unknown test: {test!r}.")
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+
+    xs, ns, pd0s, methods = np.broadcast_arrays(
+        np.asarray(x, dtype=np.int64),
+        np.asarray(n, dtype=np.int64),
+        np.asarray(pd0, dtype=np.float64),
+        np.asarray(method, dtype=np.str_),
+    )
+    xs, ns, pd0s, methods = (a.ravel() for a in (xs, ns, pd0s, methods))
+    rows = xs.size
+    tests = {name: DiscriminationTest(get_method(name)) for name in np.unique(methods).tolist()}
+    fingerprint = _fingerprint(methods, xs, ns, pd0s, test, conf_level)
+
+    checkpoint = path / CHECKPOINT
+    start = 0
+    if checkpoint.exists():
+        state = json.loads(checkpoint.read_text())
+        if state["fingerprint"] != fingerprint:
+            raise ValueError(f"{path} holds the results of a different batch.")
+        start = int(state["completed"])
+
+    mode = "r+" if start else "w+"
+    columns = {
+        name: np.lib.format.open_memmap(
+            path / f"{name}.npy", mode=mode, dtype=np.float64, shape=None if start else (rows,)
+        )
+        for name in COLUMNS
+    }
+    if not start:
+        _write_checkpoint(path, {"fingerprint": fingerprint, "rows": rows, "completed": 0})
+
+    for first in range(start, rows, checkpoint_interval):
+        block = range(first, min(first + checkpoint_interval, rows))
+        for i in block:
+            run = getattr(tests[str(methods[i])], test)
+            values = _evaluate(run, int(xs[i]), int(ns[i]), float(pd0s[i]), conf_level)
+            for column, value in zip(COLUMNS, values, strict=True):
+                columns[column][i] = value
+        for array in columns.values():
+            array.flush()
+        _write_checkpoint(path, {"fingerprint": fingerprint, "rows": rows, "completed": block.stop})
+
+    del columns
+    return load_batch(path)
+
+
+def load_batch(directory: str | Path) -> dict[str, npt.NDArray[np.float64]]:
+    """Memory-map the result columns of a batch.
+
+    Args:
+        directory: Output directory of `run_batch`.
+
+    Returns:
+        The columns by name, in the order of `COLUMNS`. Rows past the checkpoint
+        of an unfinished batch are undefined.
+    """
+    path = Path(directory)
+    return {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in COLUMNS}
@@ -0,0 +1,218 @@
+"""Bayesian grid posterior of d' for discrimination tests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .cache import ResultCache
+from .tables import D_MAX
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy.typing as npt
+
+    from .methods import DiscriminationMethod
+
+DEFAULT_GRID_SIZE = 2001
+"""Number of d' grid points in [0, `D_MAX`]."""
+
+BLOCK_SIZE = 1024
+"""Number of (x, n) pairs whose posteriors are held in memory at a time."""
+
+
+@dataclass(slots=True)
+class BayesianResults:
+    """Posterior summaries of d' and p_d for many (x, n) pairs.
+
+    Every field has the broadcast shape of the inputs. Credible intervals are
+    equal-tailed, and `probability` is the posterior probability P(p_d > pd0).
+    """
+
+    d_prime: npt.NDArray[np.float64]
+    d_prime_sd: npt.NDArray[np.float64]
+    d_prime_lower: npt.NDArray[np.float64]
+    d_prime_upper: npt.NDArray[np.float64]
+    pd: npt.NDArray[np.float64]
+    pd_lower: npt.NDArray[np.float64]
+    pd_upper: npt.NDArray[np.float64]
+    probability: npt.NDArray[np.float64]
+
+
+CURVE_CACHE_SIZE = 32
+"""Number of (method, grid size) curves kept by `BayesianTest`."""
+
+_CURVES = ResultCache(CURVE_CACHE_SIZE)
+
+
+def _curve(
+    method: DiscriminationMethod, size: int
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Evaluate the method's psychometric function on a d' grid.
+
+    Curves are cached on the method's key, so equal methods share them and the
+    methods themselves are not kept alive. P_c is made non-decreasing, which the
+    posterior summaries rely on when mapping between d' and p_d.
+
+    Returns:
+        The grid, P_c and dP_c/dd' at each grid point.
+    """
+
+    def _compute() -> tuple[
+        npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]
+    ]:
+        d = np.linspace(0, D_MAX, size)
+        table = method.table
+        pc = np.maximum.accumulate(table.psychometric_function(d))
+        return d, pc, table.derivative(d)
+
+    return _CURVES.get_or_compute((method.key, size), _compute)
+
+
+class BayesianTest:
+    """Posterior analysis of d' on a dense grid.
+
+    The binomial likelihood of x correct responses in n trials is evaluated at
+    every point of a d' grid over [0, `D_MAX`], using the method's tabulated P_c
+    curve. Recently used curves are cached by method key and grid size (see
+    `CURVE_CACHE_SIZE`) and shared by all tests. For a batch of P pairs the
+    log-likelihood is a single (P, 2) x (2, G) matrix product
+
+        [x, n - x] · [log P_c(d'), log(1 - P_c(d'))]ᵀ
+
+    which is combined with the prior and normalized row by row. Posterior means,
+    standard deviations, credible intervals and tail probabilities then follow
+    from sums over the grid, without sampling. Large batches are processed in
+    blocks of `BLOCK_SIZE` pairs to bound memory use.
+    """
+
+    def __init__(
+        self,
+        method: DiscriminationMethod,
+        prior: Callable[[npt.NDArray[np.float64]], npt.ArrayLike] | None = None,
+        grid_size: int = DEFAULT_GRID_SIZE,
+    ) -> None:
+        """Initialize a Bayesian test.
+
+        Args:
+            method: The discrimination method.
+            prior: Prior density of d', evaluated on the grid; it need not be
+                normalized. Defaults to a prior that is uniform on p_d.
+            grid_size: Number of d' grid points.
+        """
+        self.method = method
+        self.grid, self.pc, dpc = _curve(method, grid_size)
+        self.pd = (self.pc - method.guessing) / (1 - method.guessing)
+        density = dpc if prior is None else prior(self.grid)
+        weight = np.broadcast_to(np.asarray(density, dtype=np.float64), self.grid.shape)
+        with np.errstate(divide="ignore"):
+            self._log_prior = np.log(np.maximum(weight, 0))
+        # Each grid point carries the posterior mass of the cell around it.
+        midpoints = (self.grid[1:] + self.grid[:-1]) / 2
+        self._edges = np.concatenate([self.grid[:1], midpoints, self.grid[-1:]])
+        pc = np.clip(self.pc, np.finfo(np.float64).tiny, np.nextafter(1.0, 0.0))
+        self._log_pc = np.stack([np.log(pc), np.log1p(-pc)])
+
+    def _quantile(
+        self,
+        weights: npt.NDArray[np.float64],
+        cdf: npt.NDArray[np.float64],
+        target: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """Invert the piecewise-linear posterior CDF.
+
+        Returns:
+            The d' at which each row of `cdf` reaches its entry of `target`.
+        """
+        i = np.minimum((cdf < target[:, None]).sum(axis=1), self.grid.size - 1)
+        rows = np.arange(cdf.shape[0])
+        below = np.where(i > 0, cdf[rows, i - 1], 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.clip(np.nan_to_num((target - below) / weights[rows, i]), 0, 1)
+        quantile: npt.NDArray[np.float64] = self._edges[i] + t * np.diff(self._edges)[i]
+        return quantile
+
+    def posterior(
+        self,
+        x: npt.ArrayLike,
+        n: npt.ArrayLike,
+        pd0: npt.ArrayLike = 0,
+        conf_level: float = 0.95,
+    ) -> BayesianResults:
+        """Posterior summaries for many tests at once.
+
+        Args:
+            x: Numbers of correct responses.
+            n: Numbers of trials; broadcast against `x`.
+            pd0: Threshold proportions of discriminators; broadcast against `x`.
+            conf_level: Probability content of the credible intervals.
+
+        Returns:
+            BayesianResults with the posterior mean, standard deviation and credible
+            interval of d', the posterior mean and credible interval of p_d, and the
+            posterior probability that p_d exceeds `pd0`.
+        """
+        correct, trials, threshold = np.broadcast_arrays(
+            np.asarray(x, dtype=np.float64),
+            np.asarray(n, dtype=np.float64),
+            np.asarray(pd0, dtype=np.float64),
+        )
+        shape = correct.shape
+        counts = np.stack([correct.ravel(), (trials - correct).ravel()], axis=1)
+        thresholds = threshold.ravel()
+        alpha = 1 - conf_level
+        summaries = np.empty((6, counts.shape[0]))
+        for start in range(0, counts.shape[0], BLOCK_SIZE):
+            block = slice(start, start + BLOCK_SIZE)
+            summaries[:, block] = self._summarize(counts[block], thresholds[block], alpha)
+        mean, sd, lower, upper, pd, probability = (row.reshape(shape) for row in summaries)
+
+        return BayesianResults(
+            d_prime=mean,
+            d_prime_sd=sd,
+            d_prime_lower=lower,
+            d_prime_upper=upper,
+            pd=pd,
+            pd_lower=np.interp(lower, self.grid, self.pd),
+            pd_upper=np.interp(upper, self.grid, self.pd),
+            probability=probability,
+        )
+
+    def _summarize(
+        self,
+        counts: npt.NDArray[np.float64],
+        threshold: npt.NDArray[np.float64],
+        alpha: float,
+    ) -> npt.NDArray[np.float64]:
+        """Compute the posteriors of a block of pairs and summarize them.
+
+        Returns:
+            Rows of the posterior mean, standard deviation, lower and upper credible
+            limits of d', posterior mean of p_d and P(p_d > pd0).
+        """
+        with np.errstate(divide="ignore"):
+            weights = counts @ self._log_pc
+        weights += self._log_prior
+        weights -= weights.max(axis=1, keepdims=True)
+        np.exp(weights, out=weights)
+        cdf = np.cumsum(weights, axis=1)
+        total = cdf[:, -1]
+
+        mean = weights @ self.grid / total
+        variance = np.maximum(weights @ self.grid**2 / total - mean**2, 0)
+        lower = self._quantile(weights, cdf, alpha / 2 * total)
+        upper = self._quantile(weights, cdf, (1 - alpha / 2) * total)
+
+        # p_d does not decrease along the grid, so P(p_d > pd0) is one minus the CDF
+        # at the d' corresponding to pd0.
+        d0 = np.interp(threshold, self.pd, self.grid)
+        rows = np.arange(cdf.shape[0])
+        k = np.clip(np.searchsorted(self._edges, d0, side="right") - 1, 0, self.grid.size - 1)
+        below = np.where(k > 0, cdf[rows, k - 1], 0.0)
+        t = (d0 - self._edges[k]) / np.diff(self._edges)[k]
+        probability = 1 - (below + t * weights[rows, k]) / total
+        pd = weights @ self.pd / total
+        return np.stack([mean, np.sqrt(variance), lower, upper, pd, probability])
@@ -0,0 +1,136 @@
+"""Bounded, thread-safe cache of test results."""
+
+from __future__ import annotations
+
+import collections
+import copy
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from .methods import DiscriminationMethod
+
+T = TypeVar("T")
+
+DEFAULT_MAXSIZE = 4096
+"""Default number of results kept by a `ResultCache`."""
+
+
+@dataclass(frozen=True, slots=True)
+class CacheInfo:
+    """Cache statistics, as reported by `ResultCache.info`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ResultCache:
+    """Least-recently-used cache of test results.
+
+    Pass an instance to `DiscriminationTest` to reuse results of repeated queries.
+    Entries are keyed on the method's `DiscriminationMethod.key`, the test and its
+    arguments, so one cache can be shared by tests of several methods and by
+    several threads. Results are copied on the way out, so callers cannot modify
+    cached entries. A result computed concurrently by two threads on a miss is
+    computed twice and stored once.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of results kept; the least recently used
+                result is evicted beyond it.
+
+        Raises:
+            ValueError: If `maxsize` is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive.")
+        self.maxsize = maxsize
+        self._entries: collections.OrderedDict[tuple[Hashable, ...], object] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached results.
+
+        Returns:
+            The current size of the cache.
+        """
+        return len(self._entries)
+
+    def get_or_compute(self, key: tuple[Hashable, ...], compute: Callable[[], T]) -> T:
+        """Return the cached result for a key, computing and storing it on a miss.
+
+        Args:
+            key: The entry key. Its first element identifies the method, see
+                `invalidate`.
+            compute: Function computing the result on a miss. It is called without
+                holding the lock.
+
+        Returns:
+            A copy of the cached or newly computed result.
+        """
+        with self._lock:
+            cached = key in self._entries
+            if cached:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                entry = self._entries[key]
+            else:
+                self._misses += 1
+        if cached:
+            return copy.deepcopy(entry)  # type: ignore[return-value]
+
+        result = compute()
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return copy.deepcopy(result)
+
+    def info(self) -> CacheInfo:
+        """Hit and miss statistics.
+
+        Returns:
+            CacheInfo with the hits, misses, maximum and current size.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def invalidate(self, method: DiscriminationMethod | None = None) -> int:
+        """Remove cached results.
+
+        Args:
+            method: Only remove the results of this method (matched by its key).
+                All results are removed when omitted.
+
+        Returns:
+            The number of results removed.
+        """
+        with self._lock:
+            if method is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            stale = [key for key in self._entries if key[0] == method.key]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Remove all results and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,175 @@
+"""Comparison of d' estimates."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy.stats import chi2, norm
+
+from .discrimination import table_d_prime
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from .methods import DiscriminationMethod
+
+
+@dataclass(slots=True)
+class DPrimeDifference:
+    """Tests and confidence intervals for differences d'_1 - d'_2.
+
+    Every array field has the broadcast shape of the compared estimates.
+    """
+
+    difference: npt.NDArray[np.float64]
+    stderr: npt.NDArray[np.float64]
+    lower: npt.NDArray[np.float64]
+    upper: npt.NDArray[np.float64]
+    statistic: npt.NDArray[np.float64]
+    p_value: npt.NDArray[np.float64]
+    alpha: float
+
+
+@dataclass(slots=True)
+class HomogeneityResults:
+    """Chi-square test that k d' estimates share a common value."""
+
+    d_prime: float
+    statistic: float
+    df: int
+    p_value: float
+
+
+def estimate_d_primes(
+    method: DiscriminationMethod,
+    x: npt.ArrayLike,
+    n: npt.ArrayLike,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Estimate d' and its variance for many (x, n) pairs at once.
+
+    d' is obtained from the method's table and its variance from the B-value,
+    Var(d') = B(d') / n, so no psychometric function is evaluated per estimate.
+
+    Args:
+        method: The discrimination method used for every pair.
+        x: Numbers of correct responses.
+        n: Numbers of trials.
+
+    Returns:
+        A tuple of (d', variance) arrays. P_c at or below chance yields d' = 0 and
+        P_c = 1 an infinite d', as in `table_d_prime`. The variance is infinite
+        where the psychometric function is flat, including at an infinite d'.
+    """
+    trials = np.asarray(n, dtype=np.float64)
+    pc = np.asarray(x, dtype=np.float64) / trials
+    d_prime = table_d_prime(method, pc)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = np.where(np.isinf(d_prime), np.inf, method.b_value(d_prime) / trials)
+    return d_prime, variance
+
+
+def compare_d_primes(
+    d_prime1: npt.ArrayLike,
+    variance1: npt.ArrayLike,
+    d_prime2: npt.ArrayLike,
+    variance2: npt.ArrayLike,
+    conf_level: float = 0.95,
+) -> DPrimeDifference:
+    """Compare independent d' estimates with the two-sided Wald test.
+
+    H0: d'_1 = d'_2 is tested with (Bi, 2015):
+
+        Z = (d'_1 - d'_2) / √(Var(d'_1) + Var(d'_2))
+
+    The estimates may come from different methods. All arguments broadcast.
+
+    Args:
+        d_prime1: First d' estimates.
+        variance1: Variances of the first estimates.
+        d_prime2: Second d' estimates.
+        variance2: Variances of the second estimates.
+        conf_level: Confidence level of the interval for d'_1 - d'_2.
+
+    Returns:
+        DPrimeDifference with the differences, their standard errors, confidence
+        limits, Z statistics and p-values.
+    """
+    alpha = 1 - conf_level
+    difference = np.asarray(d_prime1, dtype=np.float64) - np.asarray(d_prime2, dtype=np.float64)
+    stderr = np.sqrt(np.asarray(variance1, dtype=np.float64) + np.asarray(variance2))
+    z = norm.ppf(1 - alpha / 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        statistic = difference / stderr
+    return DPrimeDifference(
+        difference=difference,
+        stderr=stderr,
+        lower=difference - z * stderr,
+        upper=difference + z * stderr,
+        statistic=statistic,
+        p_value=2 * norm.sf(np.abs(statistic)),
+        alpha=alpha,
+    )
+
+
+def pairwise_comparisons(
+    d_prime: npt.ArrayLike,
+    variance: npt.ArrayLike,
+    conf_level: float = 0.95,
+) -> DPrimeDifference:
+    """Compare every pair among k d' estimates.
+
+    Args:
+        d_prime: The k d' estimates.
+        variance: Their variances.
+        conf_level: Confidence level of the intervals.
+
+    Returns:
+        DPrimeDifference of (k, k) arrays whose entry [i, j] compares estimate i
+        with estimate j. P-values are not adjusted for multiplicity.
+    """
+    d = np.asarray(d_prime, dtype=np.float64).ravel()
+    v = np.asarray(variance, dtype=np.float64).ravel()
+    return compare_d_primes(d[:, None], v[:, None], d[None, :], v[None, :], conf_level)
+
+
+def homogeneity_test(d_prime: npt.ArrayLike, variance: npt.ArrayLike) -> HomogeneityResults:
+    """Test whether k independent d' estimates share a common value.
+
+    With weights w_i = 1 / Var(d'_i) and the weighted mean d̄', the statistic
+    (Bi, 2015)
+
+        X² = Σ w_i (d'_i - d̄')²
+
+    follows a chi-square distribution with k - 1 degrees of freedom under H0.
+    Estimates with an infinite variance, such as an infinite d' or d' = 0 for a
+    method that is flat at chance, carry no weight and are left out, so k counts
+    only the remaining estimates.
+
+    Args:
+        d_prime: The k d' estimates.
+        variance: Their variances.
+
+    Returns:
+        HomogeneityResults with the weighted mean d', X², the degrees of freedom
+        and the p-value. The mean is NaN when no estimate has a finite variance,
+        and the p-value is NaN when fewer than two have.
+
+    Raises:
+        ValueError: If fewer than two estimates are given.
+    """
+    d = np.asarray(d_prime, dtype=np.float64).ravel()
+    v = np.asarray(variance, dtype=np.float64).ravel()
+    if d.size < 2:
+        raise ValueError("At least two d' estimates are required.")
+    informative = np.isfinite(v) & np.isfinite(d)
+    d = d[informative]
+    with np.errstate(divide="ignore"):
+        w = 1 / v[informative]
+    df = d.size - 1
+    if df < 1:
+        return HomogeneityResults(float(d[0]) if d.size else np.nan, 0.0, max(df, 0), np.nan)
+    mean = float(np.sum(w * d) / np.sum(w))
+    statistic = float(np.sum(w * (d - mean) ** 2))
+    return HomogeneityResults(mean, statistic, df, float(chi2.sf(statistic, df)))
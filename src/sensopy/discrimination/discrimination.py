@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
-from scipy.optimize import fsolve
 from scipy.stats import beta, binom
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+    from .cache import ResultCache
     from .methods import DiscriminationMethod
 
 
@@ -36,6 +41,70 @@ class TestResults:
     power: float
 
 
+@dataclass(slots=True)
+class TostResults:
+    """Two one-sided tests (TOST) for similarity around the chance level."""
+
+    pc_bounds: tuple[float, float]
+    p_value: float
+    alpha: float
+    power: float
+
+
+@dataclass(slots=True)
+class Analysis:
+    """Difference, equivalence and TOST results sharing a single set of estimates."""
+
+    difference: TestResults
+    equivalence: TestResults
+    tost: TostResults
+    intervals: dict[float, tuple[Statistic, Statistic, Statistic]]
+
+
+def table_d_prime(method: DiscriminationMethod, pc: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Invert a method's psychometric function with its table, elementwise.
+
+    Args:
+        method: The discrimination method.
+        pc: Probabilities of a correct response.
+
+    Returns:
+        d' for each P_c: zero at or below chance and infinite beyond the table.
+    """
+    p = np.asarray(pc, dtype=np.float64)
+    table = method.table
+    d_prime = np.where(p >= table.pc[-1], np.inf, table.d_prime(p))
+    return np.where(p <= method.guessing, 0.0, d_prime)
+
+
+def clopper_pearson(
+    x: npt.ArrayLike,
+    n: npt.ArrayLike,
+    alpha: npt.ArrayLike,
+    pg: float = 0.0,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Exact two-sided Clopper-Pearson limits for P_c, elementwise.
+
+    Args:
+        x: Numbers of correct responses.
+        n: Numbers of trials.
+        alpha: Significance levels (1 - confidence level), broadcast against `x`.
+        pg: Guessing probability, below which the lower limit is raised.
+
+    Returns:
+        A tuple of (lower, upper) limits. The limits for x = 0 and x = n are the
+        guessing probability and one.
+    """
+    correct = np.asarray(x, dtype=np.float64)
+    trials = np.asarray(n, dtype=np.float64)
+    level = np.asarray(alpha, dtype=np.float64)
+    lower = np.maximum(np.nan_to_num(beta.ppf(level / 2, correct, trials - correct + 1)), pg)
+    upper = np.minimum(
+        np.nan_to_num(beta.ppf(1 - level / 2, correct + 1, trials - correct), nan=1.0), 1.0
+    )
+    return lower, upper
+
+
 class DiscriminationTest:
     """Difference and equivalence tests for a single sensory discrimination method.
 
@@ -47,13 +116,130 @@ class DiscriminationTest:
     (Bi, 2015, §2.3).
     """
 
-    def __init__(self, method: DiscriminationMethod) -> None:
+    def __init__(
+        self,
+        method: DiscriminationMethod,
+        cache: ResultCache | None = None,
+        tol: float | None = None,
+    ) -> None:
         """Initialize a discrimination test.
 
         Args:
             method: The sensory discrimination method to use.
+            cache: Optional cache for the results of `difference` and
+                `equivalence`, which may be shared with other tests and threads.
+            tol: Absolute tolerance on P_c and d'. By default d' and f'(d') are
+                interpolated from the method's table, and the global tolerance (see
+                `set_tolerance`) only applies to P_c the table cannot invert. With a
+                tolerance they are computed directly from the psychometric function
+                to that accuracy (see `DiscriminationMethod.d_prime`).
         """
         self.method = method
+        self.cache = cache
+        self.tol = tol
+
+    def _estimate(self, x: int, n: int) -> tuple[float, float, float, float]:
+        """Point estimates shared by every test on (x, n).
+
+        Returns:
+            A tuple of (pg, pc, pd, d_prime).
+        """
+        pg = self.method.guessing
+        pc = x / n
+        pd = (pc - pg) / (1 - pg)
+        d_prime = float(self._inverse(pc))
+        return pg, pc, pd, d_prime
+
+    def _inverse(self, pc: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Solve the psychometric function for d', elementwise.
+
+        By default d' is interpolated from the method's table (see `table_d_prime`),
+        and P_c the table cannot invert is solved directly at the global tolerance.
+        With a tolerance every P_c is solved directly (see
+        `DiscriminationMethod.d_prime`). Either way P_c at or below chance yields
+        d' = 0 and P_c beyond the reach of the psychometric function yields an
+        infinite d'.
+
+        Returns:
+            The d' whose probability of a correct response is `pc`.
+        """
+        p = np.asarray(pc, dtype=np.float64)
+        if self.tol is None:
+            d_prime = table_d_prime(self.method, p)
+            solve = np.isnan(d_prime) & ~np.isnan(p)
+        else:
+            d_prime = np.zeros_like(p)
+            solve = np.ones_like(p, dtype=np.bool_)
+        d_prime[solve] = [self.method.d_prime(float(q), self.tol)[0] for q in p[solve]]
+        return d_prime
+
+    def _derivative(self, d_prime: float) -> float:
+        """Derivative of the psychometric function.
+
+        Returns:
+            f'(d') from the method's table, or a finite-difference approximation
+            outside the tabulated range or when a tolerance is set. The
+            psychometric function is flat at an infinite d'.
+        """
+        if math.isinf(d_prime):
+            return 0.0
+        if self.tol is not None:
+            h = 1e-4
+            evaluate = self.method.evaluate
+            if d_prime >= h:
+                upper = evaluate(d_prime + h, self.tol)[0]
+                der = (upper - evaluate(d_prime - h, self.tol)[0]) / (2 * h)
+            else:
+                # Second-order one-sided difference, which vanishes at d' = 0 for
+                # methods whose psychometric function is flat there.
+                f0, f1, f2 = (evaluate(d_prime + k * h, self.tol)[0] for k in range(3))
+                der = (4 * f1 - 3 * f0 - f2) / (2 * h)
+            # Slopes within rounding error are treated as flat.
+            return der if der > 8 * np.finfo(np.float64).eps / h else 0.0
+        der = float(self.method.table.derivative(d_prime))
+        if np.isnan(der):
+            dx = 1e-6
+            f = self.method.psychometric_function
+            return (f(d_prime + dx) - f(d_prime - dx)) / (2 * dx)
+        return der
+
+    def _limits(
+        self,
+        x: int,
+        n: int,
+        pc: float,
+        pd: float,
+        pg: float,
+        d_prime: float,
+        der: float,
+        alphas: npt.NDArray[np.float64],
+    ) -> list[tuple[Statistic, Statistic, Statistic]]:
+        """Confidence limits at several significance levels.
+
+        Standard errors and f'(d') do not depend on the level, so they are computed
+        once. The Clopper-Pearson limits for all levels come from one vectorized
+        `clopper_pearson` call, and their d' from one vectorized inversion.
+
+        Returns:
+            A (pc_stat, pd_stat, d_prime_stat) tuple for each entry of `alphas`.
+        """
+        pc_err = np.sqrt(pc * (1 - pc) / n)
+        pd_err = pc_err / (1 - pg)
+        d_prime_err = pc_err / der if der > 0 else np.inf
+
+        pc_lowers, pc_uppers = clopper_pearson(x, n, alphas, pg)
+        d_lowers, d_uppers = self._inverse(np.stack([pc_lowers, pc_uppers]))
+
+        limits = []
+        for pc_lower, pc_upper, d_lower, d_upper in zip(
+            pc_lowers, pc_uppers, d_lowers, d_uppers, strict=True
+        ):
+            limits.append((
+                Statistic(pc, pc_err, pc_lower, pc_upper),
+                Statistic(pd, pd_err, (pc_lower - pg) / (1 - pg), (pc_upper - pg) / (1 - pg)),
+                Statistic(d_prime, d_prime_err, float(d_lower), float(d_upper)),
+            ))
+        return limits
 
     def limits(
         self,
@@ -72,8 +258,8 @@ class DiscriminationTest:
 
             SE(d') = SE(P_c) / f'(d')
 
-        where f'(d') is the derivative of the psychometric function, approximated
-        here by a central finite difference. Confidence limits for P_c use the
+        where f'(d') is the derivative of the psychometric function, interpolated
+        from the method's table. Confidence limits for P_c use the
         exact beta distribution (Clopper-Pearson) interval.
 
         Args:
@@ -89,28 +275,26 @@ class DiscriminationTest:
             A tuple of (pc_stat, pd_stat, d_prime_stat), each a Statistic
             namedtuple with fields (estimate, stderr, lower, upper).
         """
-        pc_err = np.sqrt(pc * (1 - pc) / n)
-        pd_err = pc_err / (1 - pg)
-        dx = 1e-6
-        f = self.method.psychometric_function
-        der = (f(d_prime + dx) - f(d_prime - dx)) / (2 * dx)
-        d_prime_err = pc_err / der
-
-        # Lower limits
-        pc_lower = max(beta.ppf(alpha / 2, x, n - x + 1), pg)
-        pd_lower = (pc_lower - pg) / (1 - pg)
-        d_prime_lower = fsolve(lambda d: self.method.psychometric_function(d) - pc_lower, 1.0)[0]  # type: ignore[arg-type,misc]
-
-        # Upper limits
-        pc_upper = min(beta.ppf(1 - alpha / 2, x + 1, n - x), 1.0)
-        pd_upper = (pc_upper - pg) / (1 - pg)
-        d_prime_upper = fsolve(lambda d: self.method.psychometric_function(d) - pc_upper, 1.0)[0]  # type: ignore[arg-type,misc]
-
-        return (
-            Statistic(pc, pc_err, pc_lower, pc_upper),
-            Statistic(pd, pd_err, pd_lower, pd_upper),
-            Statistic(d_prime, d_prime_err, d_prime_lower, d_prime_upper),
-        )
+        der = self._derivative(d_prime)
+        return self._limits(x, n, pc, pd, pg, d_prime, der, np.array([alpha]))[0]
+
+    @staticmethod
+    def _difference_stats(
+        x: int, n: int, pc: float, pc0: float, alpha: float
+    ) -> tuple[float, float]:
+        p_value = 1 - binom.cdf(x - 1, n, pc0)
+        xcrit = binom.ppf(1 - alpha, n, pc0) + 1
+        power = 1 - binom.cdf(xcrit - 1, n, pc)
+        return p_value, power
+
+    @staticmethod
+    def _equivalence_stats(
+        x: int, n: int, pc: float, pc0: float, alpha: float
+    ) -> tuple[float, float]:
+        p_value = binom.cdf(x, n, pc0)
+        xcrit = binom.ppf(alpha, n, pc0) + 1
+        power = binom.cdf(xcrit, n, pc)
+        return p_value, power
 
     def difference(
         self,
@@ -138,21 +322,24 @@ class DiscriminationTest:
             TestResults with pg, pc, pd, d_prime (each a Statistic), p_value,
             alpha, and power.
         """
+        if self.cache is not None:
+            key = (
+                self.method.key,
+                "difference",
+                int(x),
+                int(n),
+                float(pd0),
+                float(conf_level),
+                self.tol,
+            )
+            return self.cache.get_or_compute(key, lambda: self._difference(x, n, pd0, conf_level))
+        return self._difference(x, n, pd0, conf_level)
+
+    def _difference(self, x: int, n: int, pd0: float, conf_level: float) -> TestResults:
         alpha = 1 - conf_level
 
-        pg = self.method.guessing
-        pc = x / n
-        pd = (pc - pg) / (1 - pg)
-        d_prime = fsolve(lambda d: self.method.psychometric_function(d) - pc, 1.0)[0]  # type: ignore[arg-type,misc]
-
-        def stats(x: int, n: int, pc: float, pg: float, alpha: float) -> tuple[float, float]:
-            pc0 = pg + (1 - pg) * pd0
-            p_value = 1 - binom.cdf(x - 1, n, pc0)
-            xcrit = binom.ppf(1 - alpha, n, pc0) + 1
-            power = 1 - binom.cdf(xcrit - 1, n, pc)
-            return p_value, power
-
-        p_value, power = stats(x, n, pc, pg, alpha)
+        pg, pc, pd, d_prime = self._estimate(x, n)
+        p_value, power = self._difference_stats(x, n, pc, pg + (1 - pg) * pd0, alpha)
         pc_stats, pd_stats, d_prime_stats = self.limits(x, n, pc, pd, pg, d_prime, alpha)
 
         return TestResults(pg, pc_stats, pd_stats, d_prime_stats, p_value, alpha, power)
@@ -183,21 +370,108 @@ class DiscriminationTest:
             TestResults with pg, pc, pd, d_prime (each a Statistic), p_value,
             alpha, and power.
         """
+        if self.cache is not None:
+            key = (
+                self.method.key,
+                "equivalence",
+                int(x),
+                int(n),
+                float(pd0),
+                float(conf_level),
+                self.tol,
+            )
+            return self.cache.get_or_compute(key, lambda: self._equivalence(x, n, pd0, conf_level))
+        return self._equivalence(x, n, pd0, conf_level)
+
+    def _equivalence(self, x: int, n: int, pd0: float, conf_level: float) -> TestResults:
         alpha = 1 - conf_level
 
-        pg = self.method.guessing
-        pc = x / n
-        pd = (pc - pg) / (1 - pg)
-        d_prime = fsolve(lambda d: self.method.psychometric_function(d) - pc, 1.0)[0]  # type: ignore[arg-type,misc]
-
-        def stats(x: int, n: int, pc: float, pg: float, alpha: float) -> tuple[float, float]:
-            pc0 = pg + (1 - pg) * pd0
-            p_value = binom.cdf(x, n, pc0)
-            xcrit = binom.ppf(alpha, n, pc0) + 1
-            power = binom.cdf(xcrit, n, pc)
-            return p_value, power
-
-        p_value, power = stats(x, n, pc, pg, alpha)
+        pg, pc, pd, d_prime = self._estimate(x, n)
+        p_value, power = self._equivalence_stats(x, n, pc, pg + (1 - pg) * pd0, alpha)
         pc_stats, pd_stats, d_prime_stats = self.limits(x, n, pc, pd, pg, d_prime, alpha)
 
         return TestResults(pg, pc_stats, pd_stats, d_prime_stats, p_value, alpha, power)
+
+    def tost(self, x: int, n: int, pd0: float, conf_level: float = 0.95) -> TostResults:
+        """Two one-sided tests (TOST) for similarity (Bi, 2015, Chapter 5).
+
+        Tests whether performance lies within pd0 of the chance level on either side:
+
+            H0: P_c ≤ P_g - (1 - P_g) · pd0  or  P_c ≥ P_g + (1 - P_g) · pd0
+            H1: P_g - (1 - P_g) · pd0 < P_c < P_g + (1 - P_g) · pd0
+
+        The p-value is the larger of the two one-sided binomial p-values. Power is
+        evaluated at P_c = P_g. Below-chance performance is only meaningful for
+        directional methods such as 2-AFC.
+
+        Args:
+            x: Number of correct responses.
+            n: Number of panelists (trials).
+            pd0: Similarity margin expressed as a proportion of discriminators.
+            conf_level: Confidence level of the test (default 0.95).
+
+        Returns:
+            TostResults with the P_c bounds, p_value, alpha, and power.
+        """
+        alpha = 1 - conf_level
+        return self._tost(x, n, self.method.guessing, pd0, alpha)
+
+    @staticmethod
+    def _tost(x: int, n: int, pg: float, pd0: float, alpha: float) -> TostResults:
+        pc_low = max(pg - (1 - pg) * pd0, 0.0)
+        pc_high = min(pg + (1 - pg) * pd0, 1.0)
+        p_value = max(binom.sf(x - 1, n, pc_low), binom.cdf(x, n, pc_high))
+
+        xlow = binom.ppf(1 - alpha, n, pc_low) + 1
+        xhigh = binom.ppf(alpha, n, pc_high) - 1
+        power = max(binom.cdf(xhigh, n, pg) - binom.cdf(xlow - 1, n, pg), 0.0)
+
+        return TostResults((pc_low, pc_high), p_value, alpha, power)
+
+    def analyze(
+        self,
+        x: int,
+        n: int,
+        pd0: float = 0,
+        conf_level: float = 0.95,
+        interval_levels: Sequence[float] = (),
+    ) -> Analysis:
+        """Difference, equivalence and TOST results for the same data in one call.
+
+        The d' estimate, the derivative f'(d') used by the delta method and the
+        confidence limits are computed once and shared by all three tests; only the
+        binomial p-values and powers are computed per test. Additional interval
+        levels reuse the same estimates and are inverted together with the main
+        level.
+
+        Args:
+            x: Number of correct responses.
+            n: Number of panelists (trials).
+            pd0: Null-hypothesis proportion of discriminators (default 0), also used
+                as the TOST similarity margin.
+            conf_level: Confidence level of the tests (default 0.95).
+            interval_levels: Additional confidence levels for which interval
+                estimates are reported.
+
+        Returns:
+            Analysis with the difference, equivalence and TOST results, and the
+            (pc, pd, d_prime) statistics keyed by confidence level.
+        """
+        alpha = 1 - conf_level
+        levels = list(dict.fromkeys([conf_level, *interval_levels]))
+
+        pg, pc, pd, d_prime = self._estimate(x, n)
+        der = self._derivative(d_prime)
+        limits = self._limits(x, n, pc, pd, pg, d_prime, der, 1 - np.asarray(levels))
+        intervals = dict(zip(levels, limits, strict=True))
+
+        pc0 = pg + (1 - pg) * pd0
+        diff_p_value, diff_power = self._difference_stats(x, n, pc, pc0, alpha)
+        equiv_p_value, equiv_power = self._equivalence_stats(x, n, pc, pc0, alpha)
+
+        return Analysis(
+            difference=TestResults(pg, *intervals[conf_level], diff_p_value, alpha, diff_power),
+            equivalence=TestResults(pg, *intervals[conf_level], equiv_p_value, alpha, equiv_power),
+            tost=self._tost(x, n, pg, pd0, alpha),
+            intervals=intervals,
+        )
@@ -0,0 +1,349 @@
+"""Streaming ingestion of trial-level response logs.
+
+Raw exports with one row per trial are read in fixed-size chunks from CSV or
+JSON-lines files and reduced to counts of correct responses and trials per group,
+such as per product and method. Each chunk is grouped with `np.unique` and tallied
+with `np.bincount`, so memory is bounded by the chunk size and the number of groups
+rather than the size of the file. The counts are handed directly to the tests::
+
+    counts = count_trials("trials.csv", by=("product", "method"))
+    results = counts.difference()
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import itertools
+import json
+import mmap
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+import numpy as np
+
+from .discrimination import DiscriminationTest
+from .methods import get_method
+
+if TYPE_CHECKING:
+    import _csv
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+    import numpy.typing as npt
+
+    from .discrimination import TestResults
+    from .methods import DiscriminationMethod
+
+DEFAULT_CHUNK_SIZE = 100_000
+"""Number of rows read and aggregated at a time."""
+
+JSONL_SUFFIXES = frozenset({".jsonl", ".ndjson"})
+"""File suffixes read as JSON lines; everything else is read as CSV.
+
+Plain ``.json`` files usually hold a single array rather than one record per line,
+so they are not inferred as JSON lines.
+"""
+
+_TRUE = np.array(["1", "1.0", "true", "t", "yes", "y", "correct"])
+
+
+@dataclass(slots=True)
+class TrialCounts:
+    """Numbers of correct responses and trials per group."""
+
+    by: tuple[str, ...]
+    keys: list[tuple[str, ...]]
+    x: npt.NDArray[np.int64]
+    n: npt.NDArray[np.int64]
+
+    def difference(
+        self,
+        method: DiscriminationMethod | None = None,
+        pd0: float = 0,
+        conf_level: float = 0.95,
+    ) -> list[TestResults]:
+        """Run the difference test on every group.
+
+        Args:
+            method: Discrimination method for all groups. When omitted, each group's
+                method is looked up by name from its ``method`` key.
+            pd0: Threshold proportion of discriminators under H0 (default 0).
+            conf_level: Confidence level for the interval estimates.
+
+        Returns:
+            One TestResults per group, in the order of `keys`.
+
+        Raises:
+            ValueError: If no method is given and the counts are not grouped by
+                ``method``.
+        """
+        if method is None and "method" not in self.by:
+            raise ValueError("Pass a method or group the trials by 'method'.")
+        if method is not None:
+            test = DiscriminationTest(method)
+            return [
+                test.difference(int(x), int(n), pd0, conf_level)
+                for x, n in zip(self.x, self.n, strict=True)
+            ]
+        position = self.by.index("method")
+        tests: dict[str, DiscriminationTest] = {}
+        results = []
+        for key, x, n in zip(self.keys, self.x, self.n, strict=True):
+            name = key[position]
+            if name not in tests:
+                tests[name] = DiscriminationTest(get_method(name))
+            results.append(tests[name].difference(int(x), int(n), pd0, conf_level))
+        return results
+
+
+class TrialCounter:
+    """Incremental tally of trial-level responses by group.
+
+    Feed chunks of columns with `update`; counters filled in parallel can be
+    combined with `merge`.
+    """
+
+    def __init__(
+        self,
+        by: Sequence[str] = ("product", "method"),
+        correct: str = "correct",
+    ) -> None:
+        """Initialize an empty counter.
+
+        Args:
+            by: Names of the columns that define a group.
+            correct: Name of the column recording whether the response was correct.
+
+        Raises:
+            ValueError: If no grouping column is given.
+        """
+        if not by:
+            raise ValueError("At least one grouping column is required.")
+        self.by = tuple(by)
+        self.correct = correct
+        self._index: dict[tuple[str, ...], int] = {}
+        self._x = np.zeros(0, dtype=np.int64)
+        self._n = np.zeros(0, dtype=np.int64)
+
+    def _add(
+        self,
+        keys: Iterable[tuple[str, ...]],
+        x: npt.NDArray[np.int64],
+        n: npt.NDArray[np.int64],
+    ) -> None:
+        index = np.array([self._index.setdefault(key, len(self._index)) for key in keys])
+        size = len(self._index)
+        if size > self._x.size:
+            self._x = np.pad(self._x, (0, size - self._x.size))
+            self._n = np.pad(self._n, (0, size - self._n.size))
+        if index.size:
+            np.add.at(self._x, index, x)
+            np.add.at(self._n, index, n)
+
+    def update(self, columns: Mapping[str, npt.ArrayLike]) -> TrialCounter:
+        """Add a chunk of trials.
+
+        Args:
+            columns: Column arrays of equal length, including the grouping columns
+                and the correct column. Correct values may be booleans, numbers or
+                strings such as ``"1"``, ``"true"`` or ``"yes"``.
+
+        Returns:
+            The counter itself, for chaining.
+
+        Raises:
+            ValueError: If a required column is missing.
+        """
+        missing = [name for name in (*self.by, self.correct) if name not in columns]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}.")
+
+        correct = _as_bool(columns[self.correct])
+        uniques = []
+        codes = []
+        for name in self.by:
+            unique, code = np.unique(np.asarray(columns[name]).astype(str), return_inverse=True)
+            uniques.append(unique)
+            codes.append(code.ravel())
+        dims = tuple(len(unique) for unique in uniques)
+        groups, inverse = np.unique(np.ravel_multi_index(codes, dims), return_inverse=True)
+        x = np.bincount(inverse, weights=correct, minlength=len(groups)).astype(np.int64)
+        n = np.bincount(inverse, minlength=len(groups)).astype(np.int64)
+
+        positions = np.unravel_index(groups, dims)
+        keys = zip(
+            *(
+                unique[position].tolist()
+                for unique, position in zip(uniques, positions, strict=True)
+            ),
+            strict=True,
+        )
+        self._add(keys, x, n)
+        return self
+
+    def merge(self, *others: TrialCounter) -> TrialCounter:
+        """Add the tallies of other counters.
+
+        Args:
+            *others: Counters grouping by the same columns.
+
+        Returns:
+            The counter itself, for chaining.
+
+        Raises:
+            ValueError: If the grouping columns differ.
+        """
+        for other in others:
+            if other.by != self.by:
+                raise ValueError("Cannot merge counters with different grouping columns.")
+            self._add(other._index, other._x, other._n)
+        return self
+
+    def counts(self) -> TrialCounts:
+        """Counts accumulated so far.
+
+        Returns:
+            TrialCounts with the groups sorted by key.
+        """
+        keys = sorted(self._index)
+        index = np.array([self._index[key] for key in keys], dtype=np.intp)
+        return TrialCounts(self.by, keys, self._x[index], self._n[index])
+
+
+def _as_bool(values: npt.ArrayLike) -> npt.NDArray[np.bool_]:
+    array = np.asarray(values)
+    if array.dtype == np.bool_:
+        return array
+    if np.issubdtype(array.dtype, np.number):
+        nonzero: npt.NDArray[np.bool_] = array != 0
+        return nonzero
+    return np.isin(np.char.lower(np.char.strip(array.astype(str))), _TRUE)
+
+
+@contextlib.contextmanager
+def _lines(source: str | Path | IO[str], *, use_mmap: bool) -> Iterator[Iterator[str]]:
+    if not isinstance(source, (str, Path)):
+        yield iter(source)
+        return
+    if not use_mmap:
+        with Path(source).open(newline="", encoding="utf-8") as file:
+            yield iter(file)
+        return
+    with Path(source).open("rb") as file:
+        if Path(source).stat().st_size == 0:
+            yield iter(())
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield (line.decode() for line in iter(mapped.readline, b""))
+
+
+def _csv_rows(reader: _csv.Reader, width: int) -> Iterator[list[str]]:
+    """Skip empty CSV rows and check that the others hold `width` fields.
+
+    Yields:
+        The non-empty rows of the reader.
+
+    Raises:
+        ValueError: If a row is too short, naming its line number.
+    """
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            raise ValueError(
+                f"Line {reader.line_num}: expected at least {width} fields, got {len(row)}."
+            )
+        yield row
+
+
+def read_chunks(
+    source: str | Path | IO[str],
+    columns: Sequence[str] | None = None,
+    *,
+    file_format: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_mmap: bool = False,
+) -> Iterator[dict[str, npt.NDArray[np.generic]]]:
+    """Stream a CSV or JSON-lines file as chunks of column arrays.
+
+    Args:
+        source: Path of the file, or an open text stream such as ``sys.stdin``.
+        columns: Columns to keep. All columns are kept when omitted.
+        file_format: ``"csv"`` or ``"jsonl"``. Inferred from the file suffix when
+            omitted (see `JSONL_SUFFIXES`); streams default to CSV.
+        chunk_size: Maximum number of rows per chunk.
+        use_mmap: Memory-map the file instead of reading it through a buffered
+            stream. Only applies to paths.
+
+    Yields:
+        Dictionaries mapping column names to arrays of at most `chunk_size` values.
+
+    Raises:
+        ValueError: If the format is unknown, a requested column is missing or a CSV
+            row is too short to hold the requested columns.
+    """
+    if file_format is None:
+        is_jsonl = isinstance(source, (str, Path)) and Path(source).suffix in JSONL_SUFFIXES
+        file_format = "jsonl" if is_jsonl else "csv"
+    if file_format not in {"csv", "jsonl"}:
+        raise ValueError(f"Unknown file format: {file_format!r}.")
+
+    with _lines(source, use_mmap=use_mmap) as lines:
+        if file_format == "csv":
+            reader = csv.reader(lines)
+            header = next(reader, [])
+            names = header if columns is None else list(columns)
+            missing = [name for name in names if name not in header]
+            if missing:
+                raise ValueError(f"Missing columns: {', '.join(missing)}.")
+            positions = [header.index(name) for name in names]
+            rows_iter = _csv_rows(reader, max(positions, default=-1) + 1)
+            while rows := list(itertools.islice(rows_iter, chunk_size)):
+                yield {
+                    name: np.array([row[position] for row in rows])
+                    for name, position in zip(names, positions, strict=True)
+                }
+        else:
+            records = (json.loads(line) for line in lines if line.strip())
+            while chunk := list(itertools.islice(records, chunk_size)):
+                names = list(chunk[0]) if columns is None else list(columns)
+                missing = [name for name in names if any(name not in r for r in chunk)]
+                if missing:
+                    raise ValueError(f"Missing columns: {', '.join(missing)}.")
+                yield {name: np.array([record[name] for record in chunk]) for name in names}
+
+
+def count_trials(
+    source: str | Path | IO[str],
+    by: Sequence[str] = ("product", "method"),
+    correct: str = "correct",
+    *,
+    file_format: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_mmap: bool = False,
+) -> TrialCounts:
+    """Count correct responses and trials per group in a trial-level log.
+
+    Args:
+        source: Path of a CSV or JSON-lines file, or an open text stream.
+        by: Names of the columns that define a group, such as product, method
+            and session.
+        correct: Name of the column recording whether the response was correct.
+        file_format: ``"csv"`` or ``"jsonl"``; see `read_chunks`.
+        chunk_size: Number of rows aggregated at a time.
+        use_mmap: Memory-map the file; see `read_chunks`.
+
+    Returns:
+        TrialCounts with one entry per group, sorted by key.
+    """
+    counter = TrialCounter(by, correct)
+    for chunk in read_chunks(
+        source,
+        (*counter.by, correct),
+        file_format=file_format,
+        chunk_size=chunk_size,
+        use_mmap=use_mmap,
+    ):
+        counter.update(chunk)
+    return counter.counts()
@@ -3,28 +3,106 @@
 from __future__ import annotations
 
 import abc
+import contextlib
+import functools
+import hashlib
+import math
+from typing import TYPE_CHECKING
 
 import numpy as np
-import numpy.typing as npt
 import scipy.special
-from scipy.integrate import trapezoid
+from scipy.integrate import quad
+from scipy.optimize import brentq
 from scipy.stats import norm
 
 from . import mplusn
+from ._math import cdf, pdf
+from .tables import PsychometricTable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy.typing as npt
 
 __all__ = [
+    "DOUBLE_DUO_TRIO",
+    "DOUBLE_THREE_AFC",
+    "DOUBLE_TRIANGLE",
+    "DOUBLE_TWO_AFC",
     "DUAL_PAIR",
     "DUO_TRIO",
     "FOUR_AFC",
+    "METHODS",
     "SPECIFIED_TETRAD",
     "THREE_AFC",
     "TRIANGLE",
     "TWO_AFC",
     "UNSPECIFIED_TETRAD",
+    "DoubleMethod",
     "MPlusNMethod",
     "MultipleAFCMethod",
+    "get_method",
+    "get_tolerance",
+    "set_tolerance",
 ]
 
+DEFAULT_TOLERANCE = 1e-10
+"""Default absolute tolerance on P_c for numerically evaluated psychometric functions."""
+
+_tolerance = DEFAULT_TOLERANCE
+
+
+def get_tolerance() -> float:
+    """Return the global absolute tolerance on P_c.
+
+    Returns:
+        The tolerance used when a method is evaluated without an explicit `tol`.
+    """
+    return _tolerance
+
+
+def set_tolerance(tol: float | None) -> None:
+    """Set the global absolute tolerance on P_c.
+
+    The global tolerance applies whenever a method is evaluated or inverted
+    without an explicit `tol`, such as `DiscriminationMethod.psychometric_function`,
+    `DiscriminationMethod.evaluate` and `DiscriminationMethod.d_prime`. Larger
+    tolerances make adaptive quadrature stop earlier, trading accuracy for speed.
+    `DiscriminationTest` interpolates the method's table instead and only uses the
+    global tolerance for P_c the table cannot invert; pass `tol` to it to compute
+    every estimate directly. Tables are always computed to full accuracy, and the
+    Monte Carlo simulation of M + N methods has its own tolerance, see
+    `MPlusNMethod`.
+
+    Args:
+        tol: Absolute tolerance on P_c, or ``None`` to restore `DEFAULT_TOLERANCE`.
+
+    Raises:
+        ValueError: If `tol` is not positive.
+    """
+    global _tolerance
+    if tol is not None and tol <= 0:
+        raise ValueError("The tolerance must be positive.")
+    _tolerance = DEFAULT_TOLERANCE if tol is None else tol
+
+
+def _quad(
+    func: Callable[[float], float], a: float, b: float, d: float, tol: float | None
+) -> tuple[float, float]:
+    """Integrate the psychometric integrand `func` at d' = `d` over [a, b].
+
+    The integrand is undefined for a NaN d', which is returned as NaN without
+    integrating.
+
+    Returns:
+        A tuple of (integral, absolute error estimate).
+    """
+    if math.isnan(d):
+        return math.nan, math.nan
+    tol = get_tolerance() if tol is None else tol
+    value, error = quad(func, a, b, epsabs=tol, epsrel=0, limit=200)
+    return value, error
+
 
 class DiscriminationMethod(abc.ABC):
     """A sensory discrimination method."""
@@ -48,6 +126,103 @@ class DiscriminationMethod(abc.ABC):
         """Chance-level probability of a correct response when d' = 0."""
         ...
 
+    max_d_prime: float = 50.0
+    """Largest d' considered when inverting the psychometric function."""
+
+    table_name: str | None = None
+    """Name of the precomputed table shipped with the package, if any."""
+
+    @property
+    def key(self) -> str:
+        """Stable identity of the method, such as ``"MultipleAFCMethod(m=5)"``.
+
+        Methods with equal keys have the same psychometric function, so the key can
+        be used to cache results across method instances and processes.
+        """
+        return type(self).__name__
+
+    @functools.cached_property
+    def table(self) -> PsychometricTable:
+        """Psychometric function tabulated on a d' grid.
+
+        The shipped table is memory-mapped when the method has one; otherwise the
+        table is computed by direct integration on first access and cached on the
+        method.
+        """
+        table = None if self.table_name is None else PsychometricTable.load(self.table_name)
+        return PsychometricTable.from_method(self) if table is None else table
+
+    def evaluate(self, d: float, tol: float | None = None) -> tuple[float, float]:  # noqa: ARG002
+        """Psychometric function together with an absolute error estimate.
+
+        Methods with a closed-form psychometric function are exact up to rounding and
+        report a zero error. Methods that integrate numerically use adaptive
+        quadrature that stops as soon as the requested tolerance is met.
+
+        Args:
+            d: Thurstonian discriminal distance d'.
+            tol: Absolute tolerance on P_c. Defaults to the global tolerance
+                (see `set_tolerance`).
+
+        Returns:
+            A tuple of (P_c, absolute error estimate).
+        """
+        return self.psychometric_function(d), 0.0
+
+    def d_prime(self, pc: float, tol: float | None = None) -> tuple[float, float]:
+        """Invert the psychometric function to within a tolerance.
+
+        The root is bracketed on [0, `max_d_prime`] and refined with Brent's method.
+        The error estimate combines the root-finding tolerance with the error in P_c
+        propagated through the slope of the psychometric function.
+
+        Args:
+            pc: Probability of a correct response P_c.
+            tol: Absolute tolerance on P_c and d'. Defaults to the global tolerance
+                (see `set_tolerance`).
+
+        Returns:
+            A tuple of (d', absolute error estimate). P_c at or below the guessing
+            probability, or below P_c at d' = 0, yields d' = 0. P_c of one or
+            beyond the reach of `max_d_prime` yields an infinite d'. An undefined
+            P_c is treated as no evidence of a difference and also yields d' = 0.
+        """
+        tol = get_tolerance() if tol is None else tol
+        if math.isnan(pc) or pc <= self.guessing or pc <= self.evaluate(0.0, tol)[0]:
+            return 0.0, 0.0
+        if pc >= 1 or pc >= self.evaluate(self.max_d_prime, tol)[0]:
+            return math.inf, math.inf
+
+        hi = 1.0
+        while self.evaluate(hi, tol)[0] < pc:
+            hi = min(2 * hi, self.max_d_prime)
+
+        d = brentq(lambda d: self.evaluate(d, tol)[0] - pc, 0.0, hi, xtol=tol)
+        h = min(1e-4, d)
+        pc_error = self.evaluate(d, tol)[1]
+        der = (self.evaluate(d + h, tol)[0] - self.evaluate(d - h, tol)[0]) / (2 * h)
+        # A flat stretch, such as the saturated end of a simulated curve, leaves d'
+        # undetermined within it.
+        return d, tol + pc_error / der if der > 0 else math.inf
+
+    def b_value(self, d: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """B-value (variance factor) of d', interpolated from the method's table.
+
+        The delta method gives Var(d') = B / N for an estimate from N trials, with
+        (Bi, 2015, §2.3):
+
+            B = P_c(1 - P_c) / f'(d')²
+
+        Args:
+            d: Thurstonian discriminal distance d'.
+
+        Returns:
+            The B-value for each d'. It is infinite where the psychometric function
+            is flat, such as d' = 0 for the triangle method, and NaN outside the
+            tabulated range.
+        """
+        return self.table.b_value(d)
+
     def discriminators(self, d: float) -> float:
         """Proportion of discriminators (p_d) for a given d'.
 
@@ -81,6 +256,8 @@ class TriangleMethod(DiscriminationMethod):
     Guessing probability: 1/3.
     """
 
+    table_name = "triangle"
+
     def psychometric_function(self, d: float) -> float:
         """Psychometric function for the Triangle method (Bi, 2015, eq. 2.2.5).
 
@@ -90,17 +267,25 @@ class TriangleMethod(DiscriminationMethod):
         Returns:
             Probability of a correct response P_c.
         """
-        f1 = norm.pdf
-        f2 = norm.cdf
+        return self.evaluate(d)[0]
 
-        def _fi(z: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
-            x1 = -z * np.sqrt(3) + np.sqrt(2 / 3) * d
-            x2 = -z * np.sqrt(3) - np.sqrt(2 / 3) * d
-            return 2 * (f2(x1) + f2(x2)) * f1(z)  # type: ignore[no-any-return]
+    def evaluate(self, d: float, tol: float | None = None) -> tuple[float, float]:
+        """Triangle psychometric function by adaptive quadrature.
 
-        x = np.linspace(0, 200, 10000)
-        y = _fi(x)
-        return trapezoid(y, x)  # type: ignore[no-any-return]  # type: ignore[no-any-return]
+        Args:
+            d: Thurstonian discriminal distance d'.
+            tol: Absolute tolerance on P_c. Defaults to the global tolerance.
+
+        Returns:
+            A tuple of (P_c, absolute error estimate).
+        """
+        a = math.sqrt(3)
+        b = math.sqrt(2 / 3) * d
+
+        def _fi(z: float) -> float:
+            return 2 * (cdf(-z * a + b) + cdf(-z * a - b)) * pdf(z)
+
+        return _quad(_fi, 0, math.inf, d, tol)
 
     @property
     def guessing(self) -> float:
@@ -124,6 +309,8 @@ class TwoAFCMethod(DiscriminationMethod):
     Guessing probability: 1/2.
     """
 
+    table_name = "two_afc"
+
     def psychometric_function(self, d: float) -> float:
         """Psychometric function for the 2-AFC method (Bi, 2015, eq. 2.2.1).
 
@@ -156,6 +343,8 @@ class ThreeAFCMethod(DiscriminationMethod):
     Guessing probability: 1/3.
     """
 
+    table_name = "three_afc"
+
     def psychometric_function(self, d: float) -> float:
         """Psychometric function for the 3-AFC method (Bi, 2015, eq. 2.2.2).
 
@@ -165,13 +354,23 @@ class ThreeAFCMethod(DiscriminationMethod):
         Returns:
             Probability of a correct response P_c.
         """
+        return self.evaluate(d)[0]
+
+    def evaluate(self, d: float, tol: float | None = None) -> tuple[float, float]:
+        """3-AFC psychometric function by adaptive quadrature.
 
-        def _fi(z: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
-            return (norm.cdf(z) ** 2) * norm.pdf(z - d)
+        Args:
+            d: Thurstonian discriminal distance d'.
+            tol: Absolute tolerance on P_c. Defaults to the global tolerance.
+
+        Returns:
+            A tuple of (P_c, absolute error estimate).
+        """
 
-        x = np.linspace(-100, 100, 10000)
-        y = _fi(x)
-        return trapezoid(y, x)  # type: ignore[no-any-return]
+        def _fi(z: float) -> float:
+            return cdf(z + d) ** 2 * pdf(z)
+
+        return _quad(_fi, -math.inf, math.inf, d, tol)
 
     @property
     def guessing(self) -> float:
@@ -194,6 +393,8 @@ class FourAFCMethod(DiscriminationMethod):
     Guessing probability: 1/4.
     """
 
+    table_name = "four_afc"
+
     def psychometric_function(self, d: float) -> float:
         """Psychometric function for the 4-AFC method (Bi, 2015, eq. 2.2.3).
 
@@ -203,13 +404,23 @@ class FourAFCMethod(DiscriminationMethod):
         Returns:
             Probability of a correct response P_c.
         """
+        return self.evaluate(d)[0]
+
+    def evaluate(self, d: float, tol: float | None = None) -> tuple[float, float]:
+        """4-AFC psychometric function by adaptive quadrature.
+
+        Args:
+            d: Thurstonian discriminal distance d'.
+            tol: Absolute tolerance on P_c. Defaults to the global tolerance.
+
+        Returns:
+            A tuple of (P_c, absolute error estimate).
+        """
 
-        def _fi(z: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
-            return (norm.cdf(z) ** 3) * norm.pdf(z - d)
+        def _fi(z: float) -> float:
+            return cdf(z + d) ** 3 * pdf(z)
 
-        x = np.linspace(-100, 100, 10000)
-        y = _fi(x)
-        return trapezoid(y, x)  # type: ignore[no-any-return]
+        return _quad(_fi, -math.inf, math.inf, d, tol)
 
     @property
     def guessing(self) -> float:
@@ -239,6 +450,11 @@ class MultipleAFCMethod(DiscriminationMethod):
         """
         self.m = m
 
+    @property
+    def key(self) -> str:
+        """Stable identity of the method, including the number of alternatives."""
+        return f"{type(self).__name__}(m={self.m})"
+
     def psychometric_function(self, d: float) -> float:
         """Psychometric function for the m-AFC method (Bi, 2015, eq. 2.2.3 generalised).
 
@@ -248,13 +464,23 @@ class MultipleAFCMethod(DiscriminationMethod):
         Returns:
             Probability of a correct response P_c.
         """
+        return self.evaluate(d)[0]
+
+    def evaluate(self, d: float, tol: float | None = None) -> tuple[float, float]:
+        """m-AFC psychometric function by adaptive quadrature.
+
+        Args:
+            d: Thurstonian discriminal distance d'.
+            tol: Absolute tolerance on P_c. Defaults to the global tolerance.
+
+        Returns:
+            A tuple of (P_c, absolute error estimate).
+        """
 
-        def _fi(z: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
-            return (norm.cdf(z) ** (self.m - 1)) * norm.pdf(z - d)
+        def _fi(z: float) -> float:
+            return cdf(z + d) ** (self.m - 1) * pdf(z)
 
-        x = np.linspace(-100, 100, 10000)
-        y = _fi(x)
-        return trapezoid(y, x)  # type: ignore[no-any-return]
+        return _quad(_fi, -math.inf, math.inf, d, tol)
 
     @property
     def guessing(self) -> float:
@@ -277,6 +503,8 @@ class SpecifiedTetradMethod(DiscriminationMethod):
     Guessing probability: 1/6.
     """
 
+    table_name = "specified_tetrad"
+
     def psychometric_function(self, d: float) -> float:
         """Psychometric function for the Specified Tetrad method (Bi, 2015, eq. 2.2.11).
 
@@ -286,17 +514,25 @@ class SpecifiedTetradMethod(DiscriminationMethod):
         Returns:
             Probability of a correct response P_c.
         """
-        f1 = norm.pdf
-        f2 = norm.cdf
+        return self.evaluate(d)[0]
 
-        def _fi(z: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
-            return 2 * (f1(z) * f2(z) * (2 * f2(z - d) - f2(z - d) ** 2))
+    def evaluate(self, d: float, tol: float | None = None) -> tuple[float, float]:
+        """Specified Tetrad psychometric function by adaptive quadrature.
 
-        x = np.linspace(-100, 100, 10000)
-        y = _fi(x)
-        i = trapezoid(y, x)
+        Args:
+            d: Thurstonian discriminal distance d'.
+            tol: Absolute tolerance on P_c. Defaults to the global tolerance.
+
+        Returns:
+            A tuple of (P_c, absolute error estimate).
+        """
 
-        return 1 - i  # type: ignore[no-any-return]
+        def _fi(z: float) -> float:
+            cdf_d = cdf(z - d)
+            return 2 * pdf(z) * cdf(z) * (2 * cdf_d - cdf_d**2)
+
+        i, error = _quad(_fi, -math.inf, math.inf, d, tol)
+        return 1 - i, error
 
     @property
     def guessing(self) -> float:
@@ -319,6 +555,8 @@ class UnspecifiedTetrad(DiscriminationMethod):
     Guessing probability: 1/3.
     """
 
+    table_name = "unspecified_tetrad"
+
     def psychometric_function(self, d: float) -> float:
         """Psychometric function for the Unspecified Tetrad method (Bi, 2015, eq. 2.2.8).
 
@@ -328,17 +566,25 @@ class UnspecifiedTetrad(DiscriminationMethod):
         Returns:
             Probability of a correct response P_c.
         """
-        f1 = norm.pdf
-        f2 = norm.cdf
+        return self.evaluate(d)[0]
 
-        def _fi(z: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
-            return 2 * (f1(z) * (2 * f2(z) * f2(z - d) - f2(z - d) ** 2))
+    def evaluate(self, d: float, tol: float | None = None) -> tuple[float, float]:
+        """Unspecified Tetrad psychometric function by adaptive quadrature.
 
-        x = np.linspace(-100, 100, 10000)
-        y = _fi(x)
-        i = trapezoid(y, x)
+        Args:
+            d: Thurstonian discriminal distance d'.
+            tol: Absolute tolerance on P_c. Defaults to the global tolerance.
 
-        return 1 - i  # type: ignore[no-any-return]
+        Returns:
+            A tuple of (P_c, absolute error estimate).
+        """
+
+        def _fi(z: float) -> float:
+            cdf_d = cdf(z - d)
+            return 2 * pdf(z) * (2 * cdf(z) * cdf_d - cdf_d**2)
+
+        i, error = _quad(_fi, -math.inf, math.inf, d, tol)
+        return 1 - i, error
 
     @property
     def guessing(self) -> float:
@@ -361,6 +607,8 @@ class DualPairMethod(DiscriminationMethod):
     Guessing probability: 1/2.
     """
 
+    table_name = "dual_pair"
+
     def psychometric_function(self, d: float) -> float:
         """Psychometric function for the Dual Pair method (Bi, 2015, eq. 2.2.12).
 
@@ -394,6 +642,8 @@ class DuoTrioMethod(DiscriminationMethod):
     Guessing probability: 1/2.
     """
 
+    table_name = "duo_trio"
+
     def psychometric_function(self, d: float) -> float:
         """Psychometric function for the Duo-Trio method (Bi, 2015, eq. 2.2.4).
 
@@ -423,16 +673,31 @@ class MPlusNMethod(DiscriminationMethod):
     This is a generalisation of many forced-choice methods, including m-AFC, Triangle,
     and both Tetrad variants. For small M and N a binomial model applies; for larger
     M and N (M = N > 3) a single set of samples can reach statistical significance
-    under a hypergeometric model (Bi, 2015, §2.5).
+    under a hypergeometric model (Bi, 2015, §2.5); see `mplusn.mplusn_p_value` and
+    `mplusn.mplusn_single_set`, which need no simulation.
 
     The psychometric function is estimated by Monte Carlo simulation (Bi, 2015, §2.5).
 
     Guessing probability: 1/C(M+N, N) for specified or M > N; 2/C(M+N, N) otherwise.
     """
 
-    def __init__(self, m: int, n: int, specified: bool = False, *, seed: int | None = None) -> None:
+    max_d_prime = 10.0
+
+    def __init__(
+        self,
+        m: int,
+        n: int,
+        specified: bool = False,
+        *,
+        seed: int | None = None,
+        tol: float | None = None,
+    ) -> None:
         """Initialize an M + N discrimination method.
 
+        Common designs (see `MPLUSN_DESIGNS`) ship with a precomputed high-replicate
+        simulation, which is used instead of simulating when neither `seed` nor
+        `tol` is given.
+
         Args:
             m: Number of samples from product A (must be ≥ n).
             n: Number of samples from product B.
@@ -440,12 +705,67 @@ class MPlusNMethod(DiscriminationMethod):
                 version); otherwise the unspecified version is used.
             seed: Seed for the random number generator used in the Monte Carlo
                 simulation of the psychometric function. Pass an integer for
-                reproducible results; ``None`` (default) uses an unpredictable seed.
+                reproducible results; ``None`` (default) uses the precomputed table
+                when available and an unpredictable seed otherwise.
+            tol: Target standard error of the simulated P_c. Replicates are drawn
+                until it is met (up to `mplusn.SAMPLE_SIZE` per point). Defaults to
+                `mplusn.DEFAULT_TOLERANCE`.
         """
         self.m = m
         self.n = n
         self.specified = specified
-        self.psy_func = mplusn.mplusn_mc(m, n, specified=specified, seed=seed)
+        self.seed = seed
+        self.tol = tol
+        self.table_name = self.design_name(m, n, specified)
+
+        table = None
+        if seed is None and tol is None:
+            table = PsychometricTable.load(self.table_name)
+        # An unseeded simulation cannot be reproduced from the settings, so the key
+        # also records a digest of the simulated curve.
+        self._digest: str | None = None
+        if table is None:
+            table = PsychometricTable.from_curve(
+                *mplusn.mplusn_curve(
+                    m,
+                    n,
+                    specified=specified,
+                    max_delta=self.max_d_prime,
+                    seed=seed,
+                    tol=mplusn.DEFAULT_TOLERANCE if tol is None else tol,
+                )
+            )
+            if seed is None:
+                pc = np.ascontiguousarray(table.pc).tobytes()
+                self._digest = hashlib.sha256(pc).hexdigest()[:16]
+        self.table = table
+
+    @property
+    def key(self) -> str:
+        """Stable identity of the method, including the design and simulation settings.
+
+        Methods simulated without a seed also include a digest of their simulated
+        P_c, since two such methods have different psychometric functions.
+        """
+        key = (
+            f"{type(self).__name__}(m={self.m}, n={self.n}, specified={self.specified}, "
+            f"seed={self.seed}, tol={self.tol}"
+        )
+        return f"{key})" if self._digest is None else f"{key}, table={self._digest})"
+
+    @staticmethod
+    def design_name(m: int, n: int, specified: bool) -> str:
+        """Name of the precomputed table for an M + N design.
+
+        Args:
+            m: Number of samples from product A.
+            n: Number of samples from product B.
+            specified: Whether the design is the specified version.
+
+        Returns:
+            The table name.
+        """
+        return f"mplusn_{m}_{n}_{'specified' if specified else 'unspecified'}"
 
     def psychometric_function(self, d: float) -> float:
         """Psychometric function for the M + N method (Monte Carlo estimate).
@@ -455,8 +775,27 @@ class MPlusNMethod(DiscriminationMethod):
 
         Returns:
             Probability of a correct response P_c (interpolated from simulation).
+
+        Raises:
+            ValueError: If `d` is outside the simulated range [0, `max_d_prime`].
+        """
+        if not 0 <= d <= self.max_d_prime:
+            raise ValueError(f"d' = {d} is outside the simulated range.")
+        return float(self.table.psychometric_function(d))
+
+    def evaluate(self, d: float, tol: float | None = None) -> tuple[float, float]:  # noqa: ARG002
+        """Simulated psychometric function with its Monte Carlo standard error.
+
+        The accuracy is fixed when the method is created, so `tol` has no effect.
+
+        Args:
+            d: Thurstonian discriminal distance d'.
+            tol: Ignored.
+
+        Returns:
+            A tuple of (P_c, standard error of the simulated P_c).
         """
-        return self.psy_func(d)
+        return self.psychometric_function(d), float(np.interp(d, self.table.d, self.table.error))
 
     @property
     def guessing(self) -> float:
@@ -470,6 +809,77 @@ class MPlusNMethod(DiscriminationMethod):
         return float(2 / scipy.special.binom(self.m + self.n, self.n))
 
 
+class DoubleMethod(DiscriminationMethod):
+    """Double version of a discrimination method (Bi, 2015, §7.3).
+
+    Each panelist performs the base method twice and is counted as correct only if
+    both trials are correct. With independent trials:
+
+        P_c = f(d')²
+
+    where f is the psychometric function of the base method, so the guessing
+    probability is the square of the base guessing probability.
+
+    Everything is derived from the base method: its table gives the double table
+    directly (P_c = f², dP_c/dd' = 2 f f'), so no additional integrals are
+    evaluated and no table is shipped for the double versions.
+    """
+
+    def __init__(self, base: DiscriminationMethod) -> None:
+        """Initialize a double discrimination method.
+
+        Args:
+            base: The method performed twice, such as `TWO_AFC` or `TRIANGLE`.
+        """
+        self.base = base
+        self.max_d_prime = base.max_d_prime
+
+    @property
+    def key(self) -> str:
+        """Stable identity of the method, derived from the base method's key."""
+        return f"{type(self).__name__}({self.base.key})"
+
+    @functools.cached_property
+    def table(self) -> PsychometricTable:
+        """Psychometric function tabulated from the base method's table."""
+        base = self.base.table
+        return PsychometricTable(
+            base.d, base.pc**2, 2 * base.pc * base.dpc, 2 * base.pc * base.error
+        )
+
+    def psychometric_function(self, d: float) -> float:
+        """Psychometric function of the double method.
+
+        Args:
+            d: Thurstonian discriminal distance d'.
+
+        Returns:
+            Probability that both trials are correct, P_c = f(d')².
+        """
+        pc = float(self.base.table.psychometric_function(d))
+        if math.isnan(pc):
+            pc = self.base.psychometric_function(d)
+        return pc**2
+
+    def evaluate(self, d: float, tol: float | None = None) -> tuple[float, float]:
+        """Square of the base psychometric function with a propagated error.
+
+        Args:
+            d: Thurstonian discriminal distance d'.
+            tol: Absolute tolerance passed to the base method.
+
+        Returns:
+            A tuple of (P_c, absolute error estimate).
+        """
+        pc, error = self.base.evaluate(d, tol)
+        return pc**2, 2 * pc * error
+
+    @property
+    def guessing(self) -> float:
+        """Chance-level probability: the base guessing probability squared."""
+        return self.base.guessing**2
+
+
 TRIANGLE = TriangleMethod()
 TWO_AFC = TwoAFCMethod()
 THREE_AFC = ThreeAFCMethod()
@@ -478,3 +888,66 @@ SPECIFIED_TETRAD = SpecifiedTetradMethod()
 UNSPECIFIED_TETRAD = UnspecifiedTetrad()
 DUAL_PAIR = DualPairMethod()
 DUO_TRIO = DuoTrioMethod()
+DOUBLE_TRIANGLE = DoubleMethod(TRIANGLE)
+DOUBLE_TWO_AFC = DoubleMethod(TWO_AFC)
+DOUBLE_THREE_AFC = DoubleMethod(THREE_AFC)
+DOUBLE_DUO_TRIO = DoubleMethod(DUO_TRIO)
+
+BUILTIN_METHODS: tuple[DiscriminationMethod, ...] = (
+    TRIANGLE,
+    TWO_AFC,
+    THREE_AFC,
+    FOUR_AFC,
+    SPECIFIED_TETRAD,
+    UNSPECIFIED_TETRAD,
+    DUAL_PAIR,
+    DUO_TRIO,
+)
+"""Built-in method singletons, all of which ship with a precomputed table."""
+
+MPLUSN_DESIGNS: tuple[tuple[int, int, bool], ...] = tuple(
+    (m, n, specified)
+    for m, n in ((2, 2), (3, 2), (3, 3), (4, 3), (4, 4), (5, 5))
+    for specified in (False, True)
+)
+"""(M, N, specified) designs of the M + N method that ship with a precomputed table."""
+
+METHODS: dict[str, DiscriminationMethod] = {
+    **{method.table_name: method for method in BUILTIN_METHODS if method.table_name},
+    **{
+        f"double_{method.base.table_name}": method
+        for method in (DOUBLE_TRIANGLE, DOUBLE_TWO_AFC, DOUBLE_THREE_AFC, DOUBLE_DUO_TRIO)
+        if method.base.table_name
+    },
+}
+"""Method singletons by name, such as ``"triangle"`` or ``"double_two_afc"``."""
+
+
+def get_method(name: str) -> DiscriminationMethod:
+    """Look up a discrimination method by name.
+
+    Besides the names in `METHODS`, M + N designs are available under their table
+    names, such as ``"mplusn_3_3_unspecified"`` (see `MPlusNMethod.design_name`).
+
+    Args:
+        name: Method name, case-insensitive.
+
+    Returns:
+        The discrimination method.
+
+    Raises:
+        ValueError: If no method has that name.
+    """
+    key = name.strip().lower().replace("-", "_")
+    if key in METHODS:
+        return METHODS[key]
+    parts = key.split("_")
+    if len(parts) == 4 and parts[0] == "mplusn" and parts[3] in {"specified", "unspecified"}:
+        with contextlib.suppress(ValueError):
+            return _mplusn(int(parts[1]), int(parts[2]), parts[3] == "specified")
+    raise ValueError(f"Unknown discrimination method: {name!r}.")
+
+
+@functools.cache
+def _mplusn(m: int, n: int, specified: bool) -> MPlusNMethod:
+    return MPlusNMethod(m, n, specified)
@@ -7,18 +7,23 @@ from typing import TYPE_CHECKING
 import numpy as np
 import numpy.typing as npt
 from scipy import interpolate
+from scipy.stats import hypergeom
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
 SAMPLE_SIZE = 100000
+BATCH_SIZE = 2000
+
+DEFAULT_TOLERANCE = 1e-3
+"""Default target standard error of simulated P_c values."""
 
 # ------------------------------------------------------------------------------
 # "M plus N" simulation
 # ------------------------------------------------------------------------------
 
 
-def mplusn_mc(
+def mplusn_curve(
     m: int,
     n: int,
     specified: bool = False,
@@ -26,20 +31,29 @@ def mplusn_mc(
     steps: int = 300,
     seed: int | None = None,
     sample_size: int = SAMPLE_SIZE,
-) -> Callable[[float], float]:
-    """Monte Carlo simulation for M + N method.
+    tol: float = 0.0,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Monte Carlo estimate of the M + N psychometric function on a grid of d' values.
+
+    Replicates are drawn in batches of `BATCH_SIZE` until the standard error of the
+    estimated P_c falls below `tol` or `sample_size` replicates have been drawn, so
+    each grid point only uses as many replicates as the requested accuracy needs.
+    The standard error is computed from the add-one estimate (hits + 1)/(size + 2),
+    which stays positive when every replicate is a hit or a miss.
 
     Args:
-        m: TODO.
-        n: TODO.
-        specified: TODO.
-        max_delta: TODO.
-        steps: TODO.
-        seed: TODO.
-        sample_size: TODO.
+        m: Number of samples from product A.
+        n: Number of samples from product B.
+        specified: Whether the specified version of the method is simulated.
+        max_delta: Largest d' on the grid.
+        steps: Number of grid points in [0, `max_delta`].
+        seed: Seed for the random number generator.
+        sample_size: Maximum number of replicates per grid point.
+        tol: Target standard error of P_c at each grid point. The default of zero
+            always draws `sample_size` replicates.
 
     Returns:
-        TODO.
+        A tuple of (d' grid, P_c estimates, standard errors of the estimates).
 
     Raises:
         ValueError: If `m` is smaller than `n`.
@@ -48,21 +62,22 @@ def mplusn_mc(
         raise ValueError("Invalid combination of parameters. M >= N expected.")
 
     delta = np.linspace(0, max_delta, steps)
-    prop = []
+    prop = np.empty(steps)
+    stderr = np.empty(steps)
     k = m - n
 
-    def _func1(a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]) -> float:
-        return np.mean(a[-1] < b[0])  # type: ignore[no-any-return]
+    def _func1(a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]) -> int:
+        return int(np.count_nonzero(a[-1] < b[0]))
 
-    def _func2(a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]) -> float:
+    def _func2(a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]) -> int:
         cond1 = a[-1] < b[0]
         cond2 = a[0] > b[-1]
-        return np.mean(cond1 | cond2)  # type: ignore[no-any-return]
+        return int(np.count_nonzero(cond1 | cond2))
 
-    def _func3(a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]) -> float:
+    def _func3(a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]) -> int:
         cond1 = ((b[k] - b[k - 1]) < (b[0] - a[n - 1])) & (a[-1] < b[0])
         cond2 = ((b[n] - b[n - 1]) < (a[0] - b[m - 1])) & (a[0] > b[-1])
-        return np.mean(cond1 | cond2)  # type: ignore[no-any-return]
+        return int(np.count_nonzero(cond1 | cond2))
 
     # Specified test
     if specified:
@@ -76,18 +91,147 @@ def mplusn_mc(
 
     # Seed the random number generator
     rng = np.random.default_rng(seed=seed)
-    for d in delta:
-        # Samples from A ~ N(0,1)
-        a = rng.standard_normal(size=(n, sample_size))
+    for i, d in enumerate(delta):
+        hits = 0
+        size = 0
+        while size < sample_size:
+            batch = min(BATCH_SIZE, sample_size - size)
+
+            # Samples from A ~ N(0,1)
+            a = rng.standard_normal(size=(n, batch))
+
+            # Samples from B ~ N(d,1)
+            b = rng.standard_normal(size=(m, batch)) + d
 
-        # Samples from B ~ N(d,1)
-        b = rng.standard_normal(size=(m, sample_size)) + d
+            # Sort corresponding n-tuples
+            a.sort(axis=0)
+            b.sort(axis=0)
+            hits += p(a, b)
+            size += batch
 
-        # Sort corresponding n-tuples
-        a.sort(axis=0)
-        b.sort(axis=0)
-        pc = p(a, b)
+            shrunk = (hits + 1) / (size + 2)
+            if np.sqrt(shrunk * (1 - shrunk) / size) <= tol:
+                break
 
-        prop.append(pc)
+        prop[i] = hits / size
+        stderr[i] = np.sqrt(shrunk * (1 - shrunk) / size)
 
+    return delta, prop, stderr
+
+
+def mplusn_mc(
+    m: int,
+    n: int,
+    specified: bool = False,
+    max_delta: float = 10,
+    steps: int = 300,
+    seed: int | None = None,
+    sample_size: int = SAMPLE_SIZE,
+) -> Callable[[float], float]:
+    """Monte Carlo simulation for M + N method.
+
+    Args:
+        m: Number of samples from product A.
+        n: Number of samples from product B.
+        specified: Whether the specified version of the method is simulated.
+        max_delta: Largest d' on the grid.
+        steps: Number of grid points in [0, `max_delta`].
+        seed: Seed for the random number generator.
+        sample_size: Number of replicates per grid point.
+
+    Returns:
+        The psychometric function, linearly interpolated between grid points.
+    """
+    delta, prop, _ = mplusn_curve(m, n, specified, max_delta, steps, seed, sample_size)
     return interpolate.interp1d(delta, prop)  # type: ignore[return-value]
+
+
+# ------------------------------------------------------------------------------
+# "M plus N" single-set analysis
+# ------------------------------------------------------------------------------
+
+
+def _designs(
+    m: npt.ArrayLike, n: npt.ArrayLike, specified: npt.ArrayLike
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.bool_]]:
+    """Broadcast and validate M + N designs.
+
+    Returns:
+        The arrays of M, N and whether each design is folded, that is unspecified
+        with M = N, so that either group may be labelled product B.
+
+    Raises:
+        ValueError: If M is smaller than N for any design.
+    """
+    ms, ns, spec = np.broadcast_arrays(
+        np.asarray(m, dtype=np.int64), np.asarray(n, dtype=np.int64), np.asarray(specified)
+    )
+    if np.any(ms < ns):
+        raise ValueError("Invalid combination of parameters. M >= N expected.")
+    folded: npt.NDArray[np.bool_] = (ms == ns) & ~spec.astype(bool)
+    return ms, ns, folded
+
+
+def mplusn_p_value(
+    m: npt.ArrayLike,
+    n: npt.ArrayLike,
+    correct: npt.ArrayLike,
+    specified: npt.ArrayLike = False,
+) -> npt.NDArray[np.float64]:
+    """Exact p-value of a single M + N sorting under the hypergeometric model.
+
+    When the M + N samples are sorted into groups of M and N at random, the number
+    K of product B samples placed in the B group follows a hypergeometric
+    distribution with population M + N, N successes and N draws (Bi, 2015, §2.5).
+    The p-value of `correct` samples correctly placed is P(K >= `correct`). In the
+    unspecified version with M = N either group may be taken as B, so the score is
+    max(K, N - K) and the p-value doubles for `correct` > N/2 (it is one otherwise).
+
+    All arguments are broadcast against each other, so many designs and scores are
+    evaluated at once without any simulation.
+
+    Args:
+        m: Number of samples from product A.
+        n: Number of samples from product B.
+        correct: Number of B samples placed in the B group, from 0 to N.
+        specified: Whether the design is the specified version.
+
+    Returns:
+        The p-value for each design and score.
+    """
+    ms, ns, folded = _designs(m, n, specified)
+    k = np.asarray(correct, dtype=np.int64)
+    p_value = np.asarray(hypergeom.sf(k - 1, ms + ns, ns, ns), dtype=np.float64)
+    return np.where(folded, np.minimum(2 * p_value, 1.0), p_value)
+
+
+def mplusn_single_set(
+    m: npt.ArrayLike,
+    n: npt.ArrayLike,
+    specified: npt.ArrayLike = False,
+    alpha: float = 0.05,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+    """Null distribution of the score of a single M + N sorting, for many designs.
+
+    Every possible score k = 0, ..., max(N) is evaluated for every design with one
+    broadcast call to `hypergeom`.
+
+    Args:
+        m: Number of samples from product A.
+        n: Number of samples from product B.
+        specified: Whether each design is the specified version.
+        alpha: Significance level for the critical scores.
+
+    Returns:
+        A tuple of (p-values, critical scores). The p-values P(score >= k) have the
+        broadcast shape of the designs with an extra last axis over k; they are
+        zero for k > N. The critical
+        score is the smallest k with a p-value of at most `alpha`, or N + 1 if
+        even a perfect sorting is not significant.
+    """
+    ms, ns, _ = _designs(m, n, specified)
+    k = np.arange(int(ns.max(initial=0)) + 1)
+    p_value = mplusn_p_value(ms[..., None], ns[..., None], k, np.asarray(specified)[..., None])
+    significant = (p_value <= alpha) & (k <= ns[..., None])
+    critical = np.where(significant.any(axis=-1), significant.argmax(axis=-1), ns + 1)
+    return p_value, critical
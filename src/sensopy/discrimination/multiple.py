@@ -0,0 +1,146 @@
+"""Multiple-sample discrimination tests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy.stats import binom, chi2
+
+from .comparison import HomogeneityResults, estimate_d_primes
+from .discrimination import clopper_pearson, table_d_prime
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from .methods import DiscriminationMethod
+
+
+@dataclass(slots=True)
+class MultipleSampleResults:
+    """Estimates for k samples tested with the same discrimination method.
+
+    Every array field has shape (k,). Confidence limits are simultaneous at the
+    requested level.
+    """
+
+    pc: npt.NDArray[np.float64]
+    pc_lower: npt.NDArray[np.float64]
+    pc_upper: npt.NDArray[np.float64]
+    d_prime: npt.NDArray[np.float64]
+    d_prime_stderr: npt.NDArray[np.float64]
+    d_prime_lower: npt.NDArray[np.float64]
+    d_prime_upper: npt.NDArray[np.float64]
+    p_value: npt.NDArray[np.float64]
+    adjusted_p_value: npt.NDArray[np.float64]
+    homogeneity: HomogeneityResults
+    alpha: float
+
+
+def holm(p_value: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Holm step-down adjustment of p-values for multiple comparisons.
+
+    Args:
+        p_value: Unadjusted p-values.
+
+    Returns:
+        Adjusted p-values controlling the family-wise error rate, in input order.
+    """
+    p = np.asarray(p_value, dtype=np.float64).ravel()
+    order = np.argsort(p)
+    k = p.size
+    adjusted = np.minimum(np.maximum.accumulate((k - np.arange(k)) * p[order]), 1.0)
+    result = np.empty_like(p)
+    result[order] = adjusted
+    return result
+
+
+class MultipleSampleTest:
+    """Difference tests for several samples against a common reference.
+
+    Each of k samples (for example reformulations) is tested against the same
+    reference with one discrimination method, giving counts (x_i, n_i)
+    (Bi, 2015, Chapter 8). The analysis consists of:
+
+    - Pearson's chi-square test of homogeneity of the k proportions correct, a
+      k x 2 contingency table with k - 1 degrees of freedom;
+    - exact one-sided binomial tests of H0: P_c = P_g for each sample, with
+      Holm-adjusted p-values;
+    - simultaneous Clopper-Pearson intervals for P_c with a Bonferroni-corrected
+      level, mapped to d' through the method's table, and B-value standard errors.
+
+    Every step operates on arrays of all k samples at once.
+    """
+
+    def __init__(self, method: DiscriminationMethod) -> None:
+        """Initialize a multiple-sample test.
+
+        Args:
+            method: The discrimination method used for every sample.
+        """
+        self.method = method
+
+    def analyze(
+        self,
+        x: npt.ArrayLike,
+        n: npt.ArrayLike,
+        conf_level: float = 0.95,
+    ) -> MultipleSampleResults:
+        """Analyse k samples at once.
+
+        Args:
+            x: Numbers of correct responses, shape (k,).
+            n: Numbers of trials, shape (k,) or a scalar shared by all samples.
+            conf_level: Simultaneous confidence level of the intervals and
+                family-wise significance level of the adjusted p-values.
+
+        Returns:
+            MultipleSampleResults with per-sample estimates, simultaneous limits,
+            raw and Holm-adjusted p-values and the homogeneity test.
+
+        Raises:
+            ValueError: If fewer than two samples are given.
+        """
+        correct, trials = np.broadcast_arrays(
+            np.asarray(x, dtype=np.float64).ravel(), np.asarray(n, dtype=np.float64).ravel()
+        )
+        k = correct.size
+        if k < 2:
+            raise ValueError("At least two samples are required.")
+
+        alpha = 1 - conf_level
+        pg = self.method.guessing
+        pc = correct / trials
+        d_prime, variance = estimate_d_primes(self.method, correct, trials)
+
+        level = alpha / k
+        pc_lower, pc_upper = clopper_pearson(correct, trials, level, pg)
+
+        p_value = np.asarray(binom.sf(correct - 1, trials, pg), dtype=np.float64)
+
+        pooled = correct.sum() / trials.sum()
+        expected = np.stack([trials * pooled, trials * (1 - pooled)])
+        observed = np.stack([correct, trials - correct])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            statistic = float(np.sum((observed - expected) ** 2 / expected))
+        homogeneity = HomogeneityResults(
+            float(table_d_prime(self.method, pooled)),
+            statistic,
+            k - 1,
+            float(chi2.sf(statistic, k - 1)),
+        )
+
+        return MultipleSampleResults(
+            pc=pc,
+            pc_lower=pc_lower,
+            pc_upper=pc_upper,
+            d_prime=d_prime,
+            d_prime_stderr=np.sqrt(variance),
+            d_prime_lower=table_d_prime(self.method, pc_lower),
+            d_prime_upper=table_d_prime(self.method, pc_upper),
+            p_value=p_value,
+            adjusted_p_value=holm(p_value),
+            homogeneity=homogeneity,
+            alpha=alpha,
+        )
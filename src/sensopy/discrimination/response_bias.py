@@ -0,0 +1,397 @@
+"""Response-bias discrimination methods."""
+
+from __future__ import annotations
+
+import abc
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+from scipy.special import ndtr, ndtri
+from scipy.stats import norm
+
+from ._math import SQRT2, phi
+
+__all__ = [
+    "A_NOT_A",
+    "A_NOT_AR",
+    "SAME_DIFFERENT",
+    "ANotAMethod",
+    "ANotARMethod",
+    "ResponseBiasMethod",
+    "ResponseBiasResults",
+    "SameDifferentMethod",
+]
+
+_BISECTIONS = 52
+_MAX_D_PRIME = 40.0
+
+
+@dataclass(slots=True)
+class ResponseBiasResults:
+    """Estimates for one or more 2x2 tables of a response-bias method.
+
+    Every array field has the broadcast shape of the input counts; scalar inputs
+    give float fields.
+    """
+
+    d_prime: npt.NDArray[np.float64] | float
+    stderr: npt.NDArray[np.float64] | float
+    lower: npt.NDArray[np.float64] | float
+    upper: npt.NDArray[np.float64] | float
+    tau: npt.NDArray[np.float64] | float
+    statistic: npt.NDArray[np.float64] | float
+    p_value: npt.NDArray[np.float64] | float
+    alpha: float
+
+
+def _corrected(x: npt.NDArray[np.float64], n: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Proportion x/n with 0 and 1 replaced by 1/(2n) and 1 - 1/(2n).
+
+    Returns:
+        The corrected proportions.
+    """
+    rate = x / n
+    return np.clip(rate, 1 / (2 * n), 1 - 1 / (2 * n))
+
+
+def _unwrap(value: npt.NDArray[np.float64]) -> npt.NDArray[np.float64] | float:
+    """Convert a 0-d array to a float.
+
+    Returns:
+        A float for 0-d input, otherwise the array itself.
+    """
+    return float(value) if value.ndim == 0 else value
+
+
+def _quantile(p: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    return np.asarray(ndtri(np.asarray(p, dtype=np.float64)), dtype=np.float64)
+
+
+class ResponseBiasMethod(abc.ABC):
+    """A discrimination method whose responses depend on a decision criterion.
+
+    Unlike forced-choice methods, there is no single guessing probability: the
+    panelist's criterion τ is estimated together with d' from a 2x2 table of
+    responses to signal (A or different pairs) and noise (Not-A or same pairs)
+    samples (Bi, 2015, Chapter 2).
+
+    The observed hit rate H is the proportion of signal samples receiving the
+    signal response, and the false-alarm rate F is the proportion of noise samples
+    receiving the signal response. All computations are vectorized, so thousands
+    of tables can be analysed in one call.
+    """
+
+    @abc.abstractmethod
+    def d_prime(
+        self,
+        hit: npt.ArrayLike,
+        false_alarm: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Estimate d' and the criterion τ from hit and false-alarm rates.
+
+        Args:
+            hit: Hit rate H.
+            false_alarm: False-alarm rate F.
+
+        Returns:
+            A tuple of (d', τ).
+        """
+        ...
+
+    @abc.abstractmethod
+    def gradient(
+        self,
+        hit: npt.ArrayLike,
+        false_alarm: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Analytic partial derivatives of d' with respect to H and F.
+
+        Args:
+            hit: Hit rate H.
+            false_alarm: False-alarm rate F.
+
+        Returns:
+            A tuple of (∂d'/∂H, ∂d'/∂F).
+        """
+        ...
+
+    lower_bound: float = -np.inf
+    """Smallest admissible value of d'."""
+
+    def _gradient(
+        self,
+        hit: npt.ArrayLike,
+        false_alarm: npt.ArrayLike,
+        d: npt.NDArray[np.float64],  # noqa: ARG002
+        tau: npt.NDArray[np.float64],  # noqa: ARG002
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Partial derivatives at already computed estimates (d', τ).
+
+        Returns:
+            A tuple of (∂d'/∂H, ∂d'/∂F).
+        """
+        return self.gradient(hit, false_alarm)
+
+    def estimate(
+        self,
+        x_signal: npt.ArrayLike,
+        n_signal: npt.ArrayLike,
+        x_noise: npt.ArrayLike,
+        n_noise: npt.ArrayLike,
+        conf_level: float = 0.95,
+    ) -> ResponseBiasResults:
+        """Estimate d' with its standard error, confidence interval and test.
+
+        The variance of d' follows from the delta method with the analytic
+        derivatives of d':
+
+            Var(d') = (∂d'/∂H)² H(1 - H)/N_s + (∂d'/∂F)² F(1 - F)/N_n
+
+        H0: H = F (no discrimination) is tested against H1: H > F with the
+        one-sided pooled two-proportion z-test, equivalent to Pearson's chi-square
+        test of the 2x2 table.
+
+        Rates of 0 or 1, common with small panels, would give an infinite d'. They
+        are replaced by 1/(2N) and 1 - 1/(2N) before d' and its variance are
+        computed (Macmillan and Kaplan, 1985); the test uses the raw counts.
+
+        When the estimate lies on the lower bound of d', such as δ = 0 for
+        Same-Different when H ≤ F, the delta method does not apply: the standard
+        error is NaN and the interval is one-sided. Its upper limit is the
+        estimate at H = F + z(1 - alpha)·SE(H - F), the upper one-sided limit of H
+        with H truncated to F.
+
+        Args:
+            x_signal: Signal responses to signal samples.
+            n_signal: Number of signal samples N_s.
+            x_noise: Signal responses to noise samples.
+            n_noise: Number of noise samples N_n.
+            conf_level: Confidence level for the interval estimates (default 0.95).
+
+        Returns:
+            ResponseBiasResults broadcast over the input arrays, with scalar fields
+            for scalar inputs.
+        """
+        alpha = 1 - conf_level
+        xs, ns, xn, nn = np.broadcast_arrays(
+            *(np.asarray(a, dtype=np.float64) for a in (x_signal, n_signal, x_noise, n_noise))
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            hit = _corrected(xs, ns)
+            false_alarm = _corrected(xn, nn)
+            d_prime, tau = self.d_prime(hit, false_alarm)
+            boundary = d_prime <= self.lower_bound
+            grad_hit, grad_false_alarm = self._gradient(hit, false_alarm, d_prime, tau)
+            stderr = np.sqrt(
+                grad_hit**2 * hit * (1 - hit) / ns
+                + grad_false_alarm**2 * false_alarm * (1 - false_alarm) / nn
+            )
+
+            pooled = (xs + xn) / (ns + nn)
+            statistic = (xs / ns - xn / nn) / np.sqrt(pooled * (1 - pooled) * (1 / ns + 1 / nn))
+
+        z = norm.ppf(1 - alpha / 2)
+        lower = np.maximum(d_prime - z * stderr, self.lower_bound)
+        upper = d_prime + z * stderr
+        if boundary.any():
+            difference_stderr = np.sqrt(hit * (1 - hit) / ns + false_alarm * (1 - false_alarm) / nn)
+            hit_upper = np.minimum(false_alarm + norm.ppf(1 - alpha) * difference_stderr, 1)
+            stderr = np.where(boundary, np.nan, stderr)
+            lower = np.where(boundary, self.lower_bound, lower)
+            upper = np.where(boundary, self.d_prime(hit_upper, false_alarm)[0], upper)
+
+        return ResponseBiasResults(
+            d_prime=_unwrap(d_prime),
+            stderr=_unwrap(stderr),
+            lower=_unwrap(lower),
+            upper=_unwrap(upper),
+            tau=_unwrap(tau),
+            statistic=_unwrap(statistic),
+            p_value=_unwrap(np.asarray(norm.sf(statistic), dtype=np.float64)),
+            alpha=alpha,
+        )
+
+
+class ANotAMethod(ResponseBiasMethod):
+    """A-Not A method (Peryam 1958).
+
+    Panelists are familiarised with product A and then receive samples of A or
+    Not-A one at a time, responding "A" or "Not A". With H the
+    proportion of "A" responses to A samples and F the proportion of "A" responses
+    to Not-A samples, the signal detection model gives (Bi, 2015, Chapter 2):
+
+        d' = z(H) - z(F)
+
+    where z is the standard normal quantile. The criterion is τ = -z(F).
+    """
+
+    def d_prime(
+        self,
+        hit: npt.ArrayLike,
+        false_alarm: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Estimate d' and τ for the A-Not A method.
+
+        Args:
+            hit: Hit rate H.
+            false_alarm: False-alarm rate F.
+
+        Returns:
+            A tuple of (d', τ).
+        """
+        z_hit = _quantile(hit)
+        z_false_alarm = _quantile(false_alarm)
+        return z_hit - z_false_alarm, -z_false_alarm
+
+    def gradient(
+        self,
+        hit: npt.ArrayLike,
+        false_alarm: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Partial derivatives of d' for the A-Not A method.
+
+        Args:
+            hit: Hit rate H.
+            false_alarm: False-alarm rate F.
+
+        Returns:
+            A tuple of (1/φ(z(H)), -1/φ(z(F))).
+        """
+        z_hit = _quantile(hit)
+        z_false_alarm = _quantile(false_alarm)
+        return 1 / phi(z_hit), -1 / phi(z_false_alarm)
+
+
+class ANotARMethod(ANotAMethod):
+    """A-Not A with reminder (A-Not AR) method.
+
+    As A-Not A, but a reminder sample of A is presented before each test sample,
+    so each decision compares two samples. The differencing model doubles the
+    variance of the decision variable, hence (Bi, 2015, Chapter 2):
+
+        d' = √2 [z(H) - z(F)]
+    """
+
+    def d_prime(
+        self,
+        hit: npt.ArrayLike,
+        false_alarm: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Estimate d' and τ for the A-Not AR method.
+
+        Args:
+            hit: Hit rate H.
+            false_alarm: False-alarm rate F.
+
+        Returns:
+            A tuple of (d', τ).
+        """
+        d_prime, tau = super().d_prime(hit, false_alarm)
+        return SQRT2 * d_prime, SQRT2 * tau
+
+    def gradient(
+        self,
+        hit: npt.ArrayLike,
+        false_alarm: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Partial derivatives of d' for the A-Not AR method.
+
+        Args:
+            hit: Hit rate H.
+            false_alarm: False-alarm rate F.
+
+        Returns:
+            A tuple of (√2/φ(z(H)), -√2/φ(z(F))).
+        """
+        grad_hit, grad_false_alarm = super().gradient(hit, false_alarm)
+        return SQRT2 * grad_hit, SQRT2 * grad_false_alarm
+
+
+class SameDifferentMethod(ResponseBiasMethod):
+    """Same-Different method.
+
+    Panelists receive a pair of samples, either matched (AA, BB) or unmatched
+    (AB, BA), and report whether they are the same or different. Here H is the
+    proportion of "different" responses to different pairs and F the proportion of
+    "different" responses to same pairs. Under the differencing model (Bi, 2015, Chapter 2):
+
+        1 - F = 2 Φ(τ/√2) - 1
+        1 - H = Φ((τ - δ)/√2) - Φ((-τ - δ)/√2)
+
+    τ follows in closed form from F, and δ ≥ 0 is found by vectorized bisection
+    on the second equation.
+    """
+
+    lower_bound = 0.0
+
+    @staticmethod
+    def _same(tau: npt.NDArray[np.float64], d: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        return ndtr((tau - d) / SQRT2) - ndtr((-tau - d) / SQRT2)
+
+    def d_prime(
+        self,
+        hit: npt.ArrayLike,
+        false_alarm: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Estimate δ and τ for the Same-Different method.
+
+        Args:
+            hit: Hit rate H.
+            false_alarm: False-alarm rate F.
+
+        Returns:
+            A tuple of (δ, τ). δ is zero when H ≤ F.
+        """
+        h, f = np.broadcast_arrays(np.asarray(hit, dtype=np.float64), np.asarray(false_alarm))
+        tau = SQRT2 * ndtri(1 - f / 2)
+        target = 1 - h
+
+        lo = np.zeros_like(h)
+        hi = np.full_like(h, _MAX_D_PRIME)
+        for _ in range(_BISECTIONS):
+            mid = (lo + hi) / 2
+            above = self._same(tau, mid) > target
+            lo = np.where(above, mid, lo)
+            hi = np.where(above, hi, mid)
+
+        d = np.where(h >= 1, np.inf, (lo + hi) / 2)
+        d = np.where(h <= f, 0.0, d)
+        d = np.where(np.isnan(h) | np.isnan(f), np.nan, d)
+        return d, tau
+
+    def gradient(
+        self,
+        hit: npt.ArrayLike,
+        false_alarm: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Partial derivatives of δ by implicit differentiation.
+
+        Args:
+            hit: Hit rate H.
+            false_alarm: False-alarm rate F.
+
+        Returns:
+            A tuple of (∂δ/∂H, ∂δ/∂F).
+        """
+        return self._gradient(hit, false_alarm, *self.d_prime(hit, false_alarm))
+
+    def _gradient(
+        self,
+        hit: npt.ArrayLike,  # noqa: ARG002
+        false_alarm: npt.ArrayLike,  # noqa: ARG002
+        d: npt.NDArray[np.float64],
+        tau: npt.NDArray[np.float64],
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        upper = phi((tau - d) / SQRT2) / SQRT2
+        lower = phi((-tau - d) / SQRT2) / SQRT2
+        dsame_dd = lower - upper
+        dsame_dtau = upper + lower
+        dtau_dfalse_alarm = -1 / (SQRT2 * phi(tau / SQRT2))
+        return -1 / dsame_dd, -dsame_dtau * dtau_dfalse_alarm / dsame_dd
+
+
+A_NOT_A = ANotAMethod()
+A_NOT_AR = ANotARMethod()
+SAME_DIFFERENT = SameDifferentMethod()
@@ -0,0 +1,174 @@
+"""ROC curves and the area under them from streamed rating data."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+from ._math import SQRT2
+from .discrimination import Statistic
+from .rindex import RIndexTest
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+
+def auc_to_d_prime(auc: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Convert the area under the ROC curve to d'.
+
+    Under the equal-variance normal model the AUC is the proportion of correct
+    responses of a 2-AFC task, AUC = Φ(d'/√2) as in `TwoAFCMethod`, hence:
+
+        d' = √2 Φ⁻¹(AUC)
+
+    Args:
+        auc: Area under the ROC curve.
+
+    Returns:
+        The corresponding d'.
+    """
+    return np.asarray(SQRT2 * ndtri(np.asarray(auc, dtype=np.float64)), dtype=np.float64)
+
+
+def d_prime_to_auc(d_prime: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Convert d' to the area under the ROC curve, the inverse of `auc_to_d_prime`.
+
+    Args:
+        d_prime: Thurstonian discriminal distance d'.
+
+    Returns:
+        The area under the ROC curve Φ(d'/√2).
+    """
+    return np.asarray(ndtr(np.asarray(d_prime, dtype=np.float64) / SQRT2), dtype=np.float64)
+
+
+@dataclass(slots=True)
+class ROCResults:
+    """Empirical ROC curve and the discriminability measures derived from it."""
+
+    false_alarm: npt.NDArray[np.float64]
+    hit: npt.NDArray[np.float64]
+    auc: Statistic
+    d_prime: Statistic
+    p_value: float
+
+
+class ROCAccumulator:
+    """Incremental ROC analysis of rating data.
+
+    Responses are fed in chunks of any size with `update`; only the K signal and K
+    noise category counts are kept, so data that does not fit in memory can be
+    streamed through and accumulators filled by parallel workers or on separate
+    shards can be combined with `merge`. Ratings are integers in [0, K) where a
+    higher category means more confidence that the sample is the signal.
+    """
+
+    def __init__(self, categories: int) -> None:
+        """Initialize an empty accumulator.
+
+        Args:
+            categories: Number of rating categories K.
+
+        Raises:
+            ValueError: If `categories` is less than 2.
+        """
+        if categories < 2:
+            raise ValueError("categories must be at least 2.")
+        self.categories = categories
+        self.signal = np.zeros(categories, dtype=np.int64)
+        self.noise = np.zeros(categories, dtype=np.int64)
+
+    def update(self, ratings: npt.ArrayLike, signal: npt.ArrayLike) -> ROCAccumulator:
+        """Add a chunk of responses.
+
+        Args:
+            ratings: Rating category of each response.
+            signal: Whether each response was given to a signal sample.
+
+        Returns:
+            The accumulator itself, for chaining.
+        """
+        s, n = RIndexTest.counts(ratings, signal, categories=self.categories)
+        if len(s):
+            self.signal += s[0]
+            self.noise += n[0]
+        return self
+
+    def merge(self, *others: ROCAccumulator) -> ROCAccumulator:
+        """Add the counts of other accumulators, such as those of parallel workers.
+
+        Args:
+            *others: Accumulators with the same number of categories.
+
+        Returns:
+            The accumulator itself, for chaining.
+
+        Raises:
+            ValueError: If the number of categories differs.
+        """
+        for other in others:
+            if other.categories != self.categories:
+                raise ValueError("Cannot merge accumulators with different categories.")
+            self.signal += other.signal
+            self.noise += other.noise
+        return self
+
+    @property
+    def count(self) -> int:
+        """Total number of responses accumulated."""
+        return int(self.signal.sum() + self.noise.sum())
+
+    def roc(self) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Empirical ROC curve.
+
+        Each point is obtained by calling responses in category k or above "signal",
+        for k from K down to 0.
+
+        Returns:
+            Tuple of (false-alarm rate, hit rate) arrays of length K + 1, running
+            from (0, 0) to (1, 1).
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            hit = np.concatenate([[0], np.cumsum(self.signal[::-1])]) / self.signal.sum()
+            false_alarm = np.concatenate([[0], np.cumsum(self.noise[::-1])]) / self.noise.sum()
+        return false_alarm, hit
+
+    def auc(self) -> float:
+        """Area under the empirical ROC curve by the trapezoidal rule.
+
+        Returns:
+            The AUC, equal to the R-index of the accumulated counts.
+        """
+        return float(RIndexTest.r_index(self.signal, self.noise))
+
+    def result(self, conf_level: float = 0.95) -> ROCResults:
+        """Summarize the accumulated responses.
+
+        The AUC is the R-index, with its DeLong standard error and the test of
+        H0: AUC = 0.5 from `RIndexTest`. The AUC and its confidence limits are
+        mapped to d' with `auc_to_d_prime`; the standard error of d' follows from
+        the delta method.
+
+        Args:
+            conf_level: Confidence level of the interval estimates.
+
+        Returns:
+            ROCResults with the ROC curve, the AUC and d' (as Statistics) and the
+            p-value.
+        """
+        false_alarm, hit = self.roc()
+        test = RIndexTest().test(self.signal, self.noise, conf_level)
+        auc = test.r_index
+        d_prime, lower, upper = auc_to_d_prime([auc.estimate, auc.lower, auc.upper])
+        with np.errstate(divide="ignore"):
+            stderr = auc.stderr * SQRT2 * np.sqrt(2 * np.pi) * np.exp(d_prime**2 / 4)
+        return ROCResults(
+            false_alarm,
+            hit,
+            auc,
+            Statistic(float(d_prime), float(stderr), float(lower), float(upper)),
+            test.p_value,
+        )
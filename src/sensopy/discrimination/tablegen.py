@@ -0,0 +1,101 @@
+"""Regenerate the precomputed psychometric tables shipped with the package.
+
+Usage::
+
+    python -m sensopy.discrimination.tablegen [--output DIR] [NAME ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import mplusn
+from .methods import BUILTIN_METHODS, MPLUSN_DESIGNS, MPlusNMethod
+from .tables import D_MAX, DATA_DIR, STEPS, PsychometricTable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+def build(
+    directory: str | Path,
+    names: Sequence[str] = (),
+    mplusn_sample_size: int = 500_000,
+) -> list[Path]:
+    """Regenerate the shipped tables.
+
+    Built-in methods are tabulated by direct integration and M + N designs by a
+    high-replicate Monte Carlo simulation.
+
+    Args:
+        directory: Output directory.
+        names: Only regenerate the tables with these names (default: all).
+        mplusn_sample_size: Monte Carlo replicates per grid point for M + N designs.
+
+    Returns:
+        Paths of the written files.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    written = []
+
+    def _save(name: str, make_table: Callable[[], PsychometricTable]) -> None:
+        if names and name not in names:
+            return
+        path = directory / f"{name}.npy"
+        make_table().save(path)
+        written.append(path)
+
+    for method in BUILTIN_METHODS:
+        _save(str(method.table_name), functools.partial(PsychometricTable.from_method, method))
+
+    for m, n, specified in MPLUSN_DESIGNS:
+        curve = functools.partial(
+            mplusn.mplusn_curve,
+            m,
+            n,
+            specified=specified,
+            max_delta=D_MAX,
+            steps=STEPS,
+            seed=0,
+            sample_size=mplusn_sample_size,
+        )
+        _save(
+            MPlusNMethod.design_name(m, n, specified),
+            lambda curve=curve: PsychometricTable.from_curve(*curve()),  # type: ignore[misc]
+        )
+
+    return written
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command-line entry point that regenerates the shipped tables.
+
+    Args:
+        argv: Command-line arguments (default: ``sys.argv[1:]``).
+    """
+    parser = argparse.ArgumentParser(description="Regenerate the precomputed psychometric tables.")
+    parser.add_argument(
+        "--output",
+        default=Path(__file__).parent / DATA_DIR,
+        type=Path,
+        help="output directory (default: the package data directory)",
+    )
+    parser.add_argument(
+        "--sample-size",
+        default=500_000,
+        type=int,
+        help="Monte Carlo replicates per grid point for M + N designs",
+    )
+    parser.add_argument("names", nargs="*", help="only regenerate these tables")
+    args = parser.parse_args(argv)
+    for path in build(args.output, args.names, args.sample_size):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
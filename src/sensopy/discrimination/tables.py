@@ -0,0 +1,278 @@
+"""Precomputed psychometric function tables.
+
+A table holds P_c, dP_c/dd' and an error estimate on a regular grid of d' values.
+Values between grid points are obtained by cubic Hermite interpolation, which uses
+the tabulated derivative and is accurate to O(h⁴). The inverse function is obtained
+from the same table by a bracketed Newton iteration from a quadratic start.
+
+Tables for the built-in methods and for common M + N designs are shipped with the
+package as ``.npy`` files and loaded by memory-mapping, so every process on a host
+shares the same pages. Regenerate them with::
+
+    python -m sensopy.discrimination.tablegen
+"""
+
+from __future__ import annotations
+
+import functools
+import io
+from dataclasses import dataclass
+from importlib.resources import files
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from .methods import DiscriminationMethod
+
+D_MAX = 10.0
+"""Largest tabulated d'."""
+
+STEPS = 401
+"""Number of grid points in [0, D_MAX]."""
+
+DATA_DIR = "data"
+
+_DX = 1e-5
+_TOL = 1e-12
+_NEWTON_ITERATIONS = 4
+
+
+@dataclass(frozen=True, slots=True)
+class PsychometricTable:
+    """Psychometric function tabulated on a regular d' grid.
+
+    All methods accept scalars or arrays and are vectorized over their input.
+    Inputs outside the tabulated range yield NaN.
+    """
+
+    d: npt.NDArray[np.float64]
+    pc: npt.NDArray[np.float64]
+    dpc: npt.NDArray[np.float64]
+    error: npt.NDArray[np.float64]
+
+    @classmethod
+    def from_array(cls, data: npt.NDArray[np.float64]) -> PsychometricTable:
+        """Create a table from a (4, K) array of d', P_c, dP_c/dd' and error rows.
+
+        Args:
+            data: Stacked table rows. Memory-mapped arrays are used without copying.
+
+        Returns:
+            The psychometric table.
+        """
+        return cls(data[0], data[1], data[2], data[3])
+
+    @classmethod
+    def from_method(
+        cls,
+        method: DiscriminationMethod,
+        d_max: float = D_MAX,
+        steps: int = STEPS,
+    ) -> PsychometricTable:
+        """Tabulate a method by direct evaluation of its psychometric function.
+
+        The derivative is a central finite difference of the accurately integrated
+        psychometric function. It is clamped at zero, since P_c never decreases,
+        and set to exactly zero at d' = 0 when the difference there is within
+        integration error, as for methods whose psychometric function is even in
+        d'.
+
+        Args:
+            method: The discrimination method.
+            d_max: Largest tabulated d'.
+            steps: Number of grid points in [0, `d_max`].
+
+        Returns:
+            The psychometric table.
+        """
+        d = np.linspace(0, d_max, steps)
+        pc, error = np.array([method.evaluate(float(x), _TOL) for x in d]).T
+        upper = np.array([method.evaluate(float(x) + _DX, _TOL)[0] for x in d])
+        lower = np.array([method.evaluate(float(x) - _DX, _TOL)[0] for x in d])
+        dpc = np.maximum((upper - lower) / (2 * _DX), 0)
+        if abs(upper[0] - lower[0]) <= 2 * (_TOL + error[0]):
+            dpc[0] = 0.0
+        return cls(d, pc, dpc, error)
+
+    @classmethod
+    def from_curve(
+        cls,
+        d: npt.NDArray[np.float64],
+        pc: npt.NDArray[np.float64],
+        error: npt.NDArray[np.float64],
+    ) -> PsychometricTable:
+        """Create a table from a sampled curve, such as a Monte Carlo simulation.
+
+        Sampling noise can make the curve decrease locally, typically near
+        saturation. The curve is made non-decreasing with a running maximum, as
+        the inverse function requires, before the derivative is estimated from
+        the samples with second-order finite differences.
+
+        Args:
+            d: Grid of d' values.
+            pc: P_c at each grid point.
+            error: Error estimate of P_c at each grid point.
+
+        Returns:
+            The psychometric table.
+        """
+        monotone = np.maximum.accumulate(pc)
+        return cls(d, monotone, np.gradient(monotone, d), error)
+
+    @classmethod
+    def load(cls, name: str) -> PsychometricTable | None:
+        """Memory-map a table shipped with the package.
+
+        Args:
+            name: Table name, see `DiscriminationMethod.table_name`.
+
+        Returns:
+            The psychometric table, or ``None`` if no table with that name is shipped.
+        """
+        data = _load(name)
+        return None if data is None else cls.from_array(data)
+
+    def to_array(self) -> npt.NDArray[np.float64]:
+        """Stack the table into a (4, K) array.
+
+        Returns:
+            The rows d', P_c, dP_c/dd' and error.
+        """
+        return np.stack([self.d, self.pc, self.dpc, self.error])
+
+    def save(self, path: str | Path) -> None:
+        """Write the table to an ``.npy`` file.
+
+        Args:
+            path: Destination file.
+        """
+        np.save(path, self.to_array())
+
+    def _locate(
+        self,
+        d: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.intp], npt.NDArray[np.float64], float]:
+        x = np.asarray(d, dtype=np.float64)
+        h = float(self.d[1] - self.d[0])
+        # Inputs outside the table, including infinities, are located at its ends and
+        # masked by `_outside`.
+        inside = np.nan_to_num(np.clip(x, self.d[0], self.d[-1]))
+        i = np.clip((inside - self.d[0]) // h, 0, len(self.d) - 2).astype(np.intp)
+        t = (inside - self.d[i]) / h
+        return x, i, t, h
+
+    def _outside(self, x: npt.NDArray[np.float64]) -> npt.NDArray[np.bool_]:
+        outside: npt.NDArray[np.bool_] = (x < self.d[0]) | (x > self.d[-1]) | np.isnan(x)
+        return outside
+
+    def psychometric_function(self, d: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Interpolated P_c.
+
+        Args:
+            d: Thurstonian discriminal distance d'.
+
+        Returns:
+            Probability of a correct response P_c.
+        """
+        x, i, t, h = self._locate(d)
+        t2 = t * t
+        t3 = t2 * t
+        pc = (
+            (2 * t3 - 3 * t2 + 1) * self.pc[i]
+            + (t3 - 2 * t2 + t) * h * self.dpc[i]
+            + (-2 * t3 + 3 * t2) * self.pc[i + 1]
+            + (t3 - t2) * h * self.dpc[i + 1]
+        )
+        return np.where(self._outside(x), np.nan, pc)
+
+    def derivative(self, d: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Interpolated derivative dP_c/dd'.
+
+        Args:
+            d: Thurstonian discriminal distance d'.
+
+        Returns:
+            Slope of the psychometric function.
+        """
+        x, i, t, h = self._locate(d)
+        t2 = t * t
+        dpc = (
+            (6 * t2 - 6 * t) * (self.pc[i] - self.pc[i + 1]) / h
+            + (3 * t2 - 4 * t + 1) * self.dpc[i]
+            + (3 * t2 - 2 * t) * self.dpc[i + 1]
+        )
+        return np.where(self._outside(x), np.nan, dpc)
+
+    def b_value(self, d: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Variance factor B of the d' estimate.
+
+        Args:
+            d: Thurstonian discriminal distance d'.
+
+        Returns:
+            B = P_c(1 - P_c) / f'(d')², infinite where the slope vanishes.
+        """
+        pc = self.psychometric_function(d)
+        dpc = self.derivative(d)
+        with np.errstate(divide="ignore"):
+            return pc * (1 - pc) / dpc**2
+
+    def d_prime(self, pc: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Inverse of the psychometric function.
+
+        The tabulated values give the bracketing grid interval, and the root of the
+        quadratic part of the Hermite interpolant on it gives the starting point. A
+        few safeguarded Newton steps on the interpolant then refine it. The
+        quadratic start keeps the inverse accurate near d' = 0, where the
+        psychometric function of many methods is flat and a linear start converges
+        slowly.
+
+        Args:
+            pc: Probability of a correct response P_c.
+
+        Returns:
+            d' yielding `pc`, or NaN if `pc` is outside the tabulated range. P_c at
+            the start of the table, within rounding, yields the first grid point.
+        """
+        p = np.asarray(pc, dtype=np.float64)
+        # Values within rounding of the table ends, such as the guessing probability,
+        # are clamped onto the table rather than reported as outside it.
+        y = np.clip(p, self.pc[0], self.pc[-1])
+        j = np.clip(np.searchsorted(self.pc, y, side="right") - 1, 0, len(self.d) - 2)
+        lo = self.d[j]
+        hi = self.d[j + 1]
+        h = float(self.d[1] - self.d[0])
+        # P(lo + t h) = pc[j] + a t + b t² + O(t³) on the bracketing interval.
+        a = h * self.dpc[j]
+        b = 3 * (self.pc[j + 1] - self.pc[j]) - 2 * a - h * self.dpc[j + 1]
+        c = y - self.pc[j]
+        root = a + np.sqrt(np.maximum(a * a + 4 * b * c, 0))
+        t = np.divide(2 * c, root, out=np.zeros_like(root), where=root > 0)
+        d = lo + h * np.clip(t, 0, 1)
+        for _ in range(_NEWTON_ITERATIONS):
+            der = self.derivative(d)
+            step = np.divide(
+                self.psychometric_function(d) - y, der, out=np.zeros_like(d), where=der > 0
+            )
+            d = np.clip(d - step, lo, hi)
+        # Near a flat start the inverse amplifies rounding errors in P_c, so P_c
+        # within rounding of the first entry maps onto the first grid point.
+        d = np.where(y <= self.pc[0] + _TOL, self.d[0], d)
+        outside = (p < self.pc[0] - _TOL) | (p > self.pc[-1] + _TOL) | np.isnan(p)
+        return np.where(outside, np.nan, d)
+
+
+@functools.cache
+def _load(name: str) -> npt.NDArray[np.float64] | None:
+    resource = files(__package__).joinpath(DATA_DIR, f"{name}.npy")
+    if not resource.is_file():
+        return None
+    if isinstance(resource, Path):
+        return np.load(resource, mmap_mode="r")  # type: ignore[no-any-return]
+    # Resources inside an archive, such as a zipped install, have no file of their
+    # own to map, so they are read into memory.
+    return np.load(io.BytesIO(resource.read_bytes()))  # type: ignore[no-any-return]
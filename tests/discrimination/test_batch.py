@@ -0,0 +1,77 @@
+"""Tests for checkpointed batch runs."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from sensopy.discrimination import DiscriminationTest, get_method, load_batch, run_batch
+from sensopy.discrimination.batch import COLUMNS
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+METHODS = ["triangle", "two_afc", "duo_trio", "triangle", "three_afc", "two_afc", "triangle"]
+X = [20, 30, 25, 21, 18, 33, 40]
+
+
+def test_columns() -> None:
+    """Columns mirror the TestResults and Statistic fields."""
+    assert COLUMNS[:5] == ("pg", "pc_estimate", "pc_stderr", "pc_lower", "pc_upper")
+    assert COLUMNS[-4:] == ("p_value", "alpha", "power", "error")
+
+
+def test_invalid_rows(tmp_path: Path) -> None:
+    """Rows that cannot be evaluated are flagged and do not stop the batch."""
+    columns = run_batch(tmp_path, "triangle", [20, 0, 6, 25], [50, 0, 5, 50])
+    np.testing.assert_array_equal(columns["error"], [0, 1, 1, 0])
+    assert np.isnan(columns["p_value"][1:3]).all()
+    expected = DiscriminationTest(get_method("triangle")).difference(25, 50)
+    assert columns["p_value"][3] == pytest.approx(expected.p_value)
+    with pytest.raises(ValueError, match="Unknown"):
+        run_batch(tmp_path / "unknown", "pentad", [1], 2)
+
+
+def test_resume(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """An interrupted batch resumes after its last checkpoint."""
+    calls = 0
+    fail_at = 6
+    difference = DiscriminationTest.difference
+
+    def _counting(self: DiscriminationTest, *args: float) -> object:
+        nonlocal calls
+        calls += 1
+        if calls == fail_at:
+            raise RuntimeError
+        return difference(self, *args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(DiscriminationTest, "difference", _counting)
+    with pytest.raises(RuntimeError):
+        run_batch(tmp_path, METHODS, X, 50, checkpoint_interval=2)
+    assert np.load(tmp_path / "p_value.npy", mmap_mode="r").shape == (7,)
+
+    calls = 0
+    fail_at = 0
+    columns = run_batch(tmp_path, METHODS, X, 50, checkpoint_interval=2)
+    # Rows 0-3 were checkpointed before the failure at row 5.
+    assert calls == 3
+    monkeypatch.undo()
+    for i, (name, x) in enumerate(zip(METHODS, X, strict=True)):
+        expected = DiscriminationTest(get_method(name)).difference(x, 50)
+        assert columns["p_value"][i] == pytest.approx(expected.p_value)
+        assert columns["d_prime_upper"][i] == pytest.approx(expected.d_prime.upper)
+
+    assert load_batch(tmp_path)["pg"][1] == pytest.approx(0.5)
+    with pytest.raises(ValueError, match="different batch"):
+        run_batch(tmp_path, METHODS, X, 60)
+
+
+def test_equivalence(tmp_path: Path) -> None:
+    """Equivalence tests with broadcast thresholds are supported."""
+    columns = run_batch(tmp_path, "triangle", [20, 25], 50, 0.3, test="equivalence")
+    expected = DiscriminationTest(get_method("triangle")).equivalence(25, 50, 0.3)
+    assert columns["p_value"][1] == pytest.approx(expected.p_value)
+    with pytest.raises(ValueError, match="Unknown test"):
+        run_batch(tmp_path, "triangle", [20], 50, test="tost")
@@ -0,0 +1,52 @@
+"""Tests for the Bayesian grid posterior."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy.stats import beta
+
+from sensopy.discrimination import TRIANGLE, TWO_AFC, BayesianTest, MultipleAFCMethod
+from sensopy.discrimination.bayes import _CURVES
+
+
+def test_uniform_pd_prior_matches_beta_posterior() -> None:
+    """With a prior uniform on p_d, P_c has a truncated beta posterior."""
+    x = np.array([10, 20, 30, 45, 58])
+    n = 60
+    pd0 = np.array([0, 0.1, 0.3, 0.5, 0.9])
+    result = BayesianTest(TRIANGLE).posterior(x, n, pd0)
+
+    pg = TRIANGLE.guessing
+    posterior = beta(x + 1, n - x + 1)
+    mass = posterior.sf(pg)
+    np.testing.assert_allclose(
+        result.probability, posterior.sf(pg + pd0 * (1 - pg)) / mass, atol=1e-5
+    )
+    for q, limit in ((0.025, result.pd_lower), (0.975, result.pd_upper)):
+        pc = posterior.ppf(posterior.cdf(pg) + q * mass)
+        np.testing.assert_allclose(limit, (pc - pg) / (1 - pg), atol=1e-5)
+    assert np.all(result.d_prime_lower < result.d_prime)
+    assert np.all(result.d_prime < result.d_prime_upper)
+
+
+def test_posterior_broadcasts_and_uses_prior() -> None:
+    """Results take the broadcast shape, and an informative prior shrinks d'."""
+    test = BayesianTest(TWO_AFC)
+    result = test.posterior([[30, 40], [50, 60]], 60, conf_level=0.9)
+    assert result.d_prime.shape == (2, 2)
+    assert np.all(np.diff(result.d_prime.ravel()) > 0)
+
+    shrunk = BayesianTest(TWO_AFC, prior=lambda d: np.exp(-(d**2) / 2)).posterior(50, 60)
+    assert float(shrunk.d_prime) < float(test.posterior(50, 60).d_prime)
+    assert float(shrunk.probability) == pytest.approx(1.0)
+
+
+def test_curves_are_cached_by_key() -> None:
+    """Equal methods share a curve, and p_d does not decrease along the grid."""
+    _CURVES.clear()
+    first = BayesianTest(MultipleAFCMethod(4), grid_size=101)
+    second = BayesianTest(MultipleAFCMethod(4), grid_size=101)
+    assert (_CURVES.info().hits, _CURVES.info().misses) == (1, 1)
+    np.testing.assert_array_equal(first.pc, second.pc)
+    assert np.all(np.diff(first.pd) >= 0)
@@ -0,0 +1,82 @@
+"""Tests for the result cache."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sensopy.discrimination import (
+    DOUBLE_TRIANGLE,
+    TRIANGLE,
+    DiscriminationTest,
+    MPlusNMethod,
+    MultipleAFCMethod,
+    ResultCache,
+)
+
+
+def test_method_keys() -> None:
+    """Keys identify methods by type and parameters."""
+    assert TRIANGLE.key == "TriangleMethod"
+    assert MultipleAFCMethod(5).key == MultipleAFCMethod(5).key != MultipleAFCMethod(6).key
+    assert DOUBLE_TRIANGLE.key == "DoubleMethod(TriangleMethod)"
+    assert MPlusNMethod(3, 3).key != MPlusNMethod(3, 3, specified=True).key
+    assert MPlusNMethod(3, 3).key == MPlusNMethod(3, 3).key
+    assert "seed=None" in MPlusNMethod(3, 3).key
+    assert MPlusNMethod(4, 2, seed=1, tol=0.02).key == MPlusNMethod(4, 2, seed=1, tol=0.02).key
+
+
+def test_unseeded_simulation_keys() -> None:
+    """Unseeded simulations of the same design do not share cache entries."""
+    first, second = MPlusNMethod(4, 2, tol=0.02), MPlusNMethod(4, 2, tol=0.02)
+    assert "table=" in first.key
+    assert first.key != second.key
+
+    cache = ResultCache()
+    DiscriminationTest(first, cache).difference(10, 30)
+    DiscriminationTest(second, cache).difference(10, 30)
+    assert cache.info().misses == 2
+
+
+def test_hits_and_eviction() -> None:
+    """Repeated queries hit, distinct arguments miss and old entries are evicted."""
+    cache = ResultCache(maxsize=2)
+    test = DiscriminationTest(TRIANGLE, cache)
+    first = test.difference(20, 40)
+    assert test.difference(20, 40) == first
+    assert test.difference(20, 40, conf_level=0.9) != first
+    test.equivalence(20, 40)
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 2)
+
+    # Cached results cannot be modified through returned copies.
+    result = test.equivalence(20, 40)
+    result.pc.estimate = 0
+    assert test.equivalence(20, 40).pc.estimate == pytest.approx(0.5)
+
+    # The first query was evicted, and the results match an uncached test.
+    assert test.difference(20, 40) == DiscriminationTest(TRIANGLE).difference(20, 40)
+    assert cache.info().misses == 4
+
+
+def test_invalidate_and_threads() -> None:
+    """Entries are invalidated per method and the cache is shared across threads."""
+    cache = ResultCache()
+    triangle = DiscriminationTest(TRIANGLE, cache)
+    three_afc = DiscriminationTest(MultipleAFCMethod(3), cache)
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(lambda x: triangle.difference(x, 30), [15, 20, 25] * 4))
+        list(executor.map(lambda x: three_afc.difference(x, 30), [15, 20, 25] * 4))
+
+    info = cache.info()
+    assert info.currsize == 6
+    assert info.hits + info.misses == 24
+    assert cache.invalidate(MultipleAFCMethod(3)) == 3
+    assert len(cache) == 3
+    assert cache.invalidate() == 3
+    cache.clear()
+    assert cache.info().hits == 0
+    with pytest.raises(ValueError, match="positive"):
+        ResultCache(0)
@@ -0,0 +1,82 @@
+"""Tests for the comparison of d' estimates."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from sensopy.discrimination import (
+    TRIANGLE,
+    TWO_AFC,
+    DiscriminationTest,
+    MultipleSampleTest,
+    compare_d_primes,
+    estimate_d_primes,
+    homogeneity_test,
+    pairwise_comparisons,
+)
+
+
+def test_b_value() -> None:
+    """B-values match the closed form for 2-AFC and the delta-method SE."""
+    assert TWO_AFC.b_value(0.0) == pytest.approx(np.pi)
+    assert np.isinf(TRIANGLE.b_value(0.0))
+
+    d_prime, variance = estimate_d_primes(TRIANGLE, 60, 100)
+    result = DiscriminationTest(TRIANGLE).difference(60, 100)
+    assert d_prime == pytest.approx(result.d_prime.estimate)
+    assert np.sqrt(variance) == pytest.approx(result.d_prime.stderr, rel=1e-4)
+
+
+def test_compare() -> None:
+    """Vectorized comparisons agree with the scalar Wald test."""
+    d_prime, variance = estimate_d_primes(TRIANGLE, [45, 60, 75], 100)
+    assert d_prime.shape == (3,)
+
+    result = compare_d_primes(d_prime[2], variance[2], d_prime[0], variance[0])
+    z = (d_prime[2] - d_prime[0]) / np.sqrt(variance[2] + variance[0])
+    assert result.statistic == pytest.approx(z)
+    assert result.lower < result.difference < result.upper
+    assert result.p_value < 0.05
+
+    matrix = pairwise_comparisons(d_prime, variance)
+    assert matrix.difference.shape == (3, 3)
+    assert matrix.statistic[2, 0] == pytest.approx(z)
+    np.testing.assert_allclose(matrix.p_value, matrix.p_value.T)
+    np.testing.assert_allclose(np.diag(matrix.p_value), 1.0)
+
+
+def test_homogeneity() -> None:
+    """Equal estimates are homogeneous and distinct ones are not."""
+    same = homogeneity_test([1.0, 1.0, 1.0], [0.1, 0.2, 0.3])
+    assert same.d_prime == pytest.approx(1.0)
+    assert same.statistic == pytest.approx(0.0)
+    assert same.df == 2
+    assert same.p_value == pytest.approx(1.0)
+
+    different = homogeneity_test([0.5, 1.5, 2.5], [0.05, 0.05, 0.05])
+    assert different.p_value < 0.001
+    with pytest.raises(ValueError, match="At least two"):
+        homogeneity_test([1.0], [0.1])
+
+
+def test_extreme_counts() -> None:
+    """All-correct counts give an infinite d' and variance like MultipleSampleTest."""
+    d_prime, variance = estimate_d_primes(TRIANGLE, [30, 20, 0], 30)
+    assert np.isinf(d_prime[0])
+    assert d_prime[2] == pytest.approx(0.0)
+    assert np.isinf(variance[[0, 2]]).all()
+
+    result = MultipleSampleTest(TRIANGLE).analyze([30, 20, 0], [30, 30, 30])
+    np.testing.assert_array_equal(result.d_prime, d_prime)
+    np.testing.assert_allclose(result.d_prime_stderr, np.sqrt(variance))
+
+    homogeneity = homogeneity_test(d_prime, variance)
+    assert homogeneity.d_prime == pytest.approx(d_prime[1])
+    assert homogeneity.statistic == pytest.approx(0.0)
+    assert homogeneity.df == 0
+    assert np.isnan(homogeneity.p_value)
+
+    mixed = homogeneity_test([1.0, 2.0, np.inf], [0.1, 0.1, np.inf])
+    assert mixed.d_prime == pytest.approx(1.5)
+    assert mixed.df == 1
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 import pytest
 
 from sensopy import DiscriminationTest
 from sensopy.discrimination import (
+    DOUBLE_TRIANGLE,
     DUAL_PAIR,
     DUO_TRIO,
     FOUR_AFC,
@@ -72,3 +74,78 @@ def tests_discrimination(
     t2 = test.equivalence(correct, panelists)
     assert t2.pc.estimate == pytest.approx(correct / panelists)
     assert t2.p_value > 0.95
+
+
+@pytest.mark.parametrize(
+    "method", [TRIANGLE, DUO_TRIO, DUAL_PAIR, UNSPECIFIED_TETRAD], ids=lambda m: m.key
+)
+def test_stderr_at_chance(method: DiscriminationMethod) -> None:
+    """Where the psychometric function is flat at chance, SE(d') is infinite."""
+    n = 30
+    d_prime = DiscriminationTest(method).difference(round(method.guessing * n), n).d_prime
+    assert d_prime.estimate == 0
+    assert d_prime.stderr == math.inf
+    assert d_prime.lower == 0
+    assert method.b_value(0) == math.inf
+
+
+def test_analysis_matches_separate_tests() -> None:
+    """A combined analysis reproduces the separate difference and equivalence tests."""
+    test = DiscriminationTest(TRIANGLE)
+    analysis = test.analyze(19, 30, pd0=0.2, interval_levels=(0.90, 0.99))
+
+    assert analysis.difference == test.difference(19, 30, pd0=0.2)
+    assert analysis.equivalence == test.equivalence(19, 30, pd0=0.2)
+    assert list(analysis.intervals) == [0.95, 0.90, 0.99]
+
+    narrow = analysis.intervals[0.90][2]
+    wide = analysis.intervals[0.99][2]
+    assert wide.lower < narrow.lower < narrow.upper < wide.upper
+    pc, pd, d_prime = analysis.intervals[0.99]
+    assert (pc, pd, d_prime) == test.limits(
+        19, 30, pc.estimate, pd.estimate, TRIANGLE.guessing, d_prime.estimate, 1 - 0.99
+    )
+
+
+def test_tost() -> None:
+    """TOST rejects dissimilarity only when P_c is close to chance on both sides."""
+    test = DiscriminationTest(TWO_AFC)
+
+    similar = test.tost(100, 200, pd0=0.2)
+    assert similar.pc_bounds == pytest.approx((0.4, 0.6))
+    assert similar.p_value < similar.alpha
+    assert 0 < similar.power < 1
+
+    assert test.tost(70, 100, pd0=0.2).p_value > 0.5
+    assert test.analyze(100, 200, pd0=0.2).tost == similar
+
+
+def test_tolerance() -> None:
+    """With a tolerance d' is computed directly and agrees with the table."""
+    tabulated = DiscriminationTest(THREE_AFC).difference(19, 30)
+    direct = DiscriminationTest(THREE_AFC, tol=1e-8).difference(19, 30)
+    assert direct.d_prime.estimate == pytest.approx(tabulated.d_prime.estimate, abs=1e-6)
+    assert direct.d_prime.stderr == pytest.approx(tabulated.d_prime.stderr, rel=1e-4)
+    assert direct.d_prime.lower == pytest.approx(tabulated.d_prime.lower, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "method",
+    [TRIANGLE, TWO_AFC, FOUR_AFC, MultipleAFCMethod(5), DOUBLE_TRIANGLE, MPlusNMethod(3, 3)],
+    ids=lambda m: m.key,
+)
+def test_extreme_counts(method: DiscriminationMethod) -> None:
+    """No, below-chance and all correct responses give d' = 0 and infinity with any tol."""
+    for tol in (None, 1e-6):
+        test = DiscriminationTest(method, tol=tol)
+        for x in (0, 3):
+            d_prime = test.difference(x, 30).d_prime
+            assert (d_prime.estimate, d_prime.lower) == (0, 0)
+            assert d_prime.stderr >= 0
+            assert d_prime.upper >= 0
+        d_prime = test.difference(30, 30).d_prime
+        assert d_prime.estimate == d_prime.upper == math.inf
+        assert 0 < d_prime.lower < math.inf
+
+    assert method.d_prime(math.nan) == (0, 0)
+    assert method.d_prime(1.0)[0] == math.inf
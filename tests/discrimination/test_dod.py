@@ -0,0 +1,62 @@
+"""Tests for the Degree of Difference test."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from sensopy.discrimination import DegreeOfDifferenceTest
+
+TAU = np.array([0.6, 1.4, 2.4])
+
+
+def test_gradient() -> None:
+    """The analytic gradient matches central finite differences."""
+    same = np.array([20, 15, 10, 5])
+    different = np.array([8, 12, 15, 15])
+    d = 1.3
+    _, grad_tau, grad_d = DegreeOfDifferenceTest.log_likelihood(same, different, TAU, d)
+
+    h = 1e-6
+
+    def _ll(tau: np.ndarray, d: float) -> float:
+        return float(DegreeOfDifferenceTest.log_likelihood(same, different, tau, d)[0][0])
+
+    numeric_tau = [(_ll(TAU + h * e, d) - _ll(TAU - h * e, d)) / (2 * h) for e in np.eye(3)]
+    np.testing.assert_allclose(grad_tau[0], numeric_tau, rtol=1e-6)
+    assert grad_d[0] == pytest.approx((_ll(TAU, d + h) - _ll(TAU, d - h)) / (2 * h), rel=1e-6)
+
+
+def test_fit_many() -> None:
+    """Batch fitting recovers simulated distances and matches single fits."""
+    rng = np.random.default_rng(0)
+    d_true = np.array([1.0, 1.5, 2.0, 2.5, 3.0])
+    p_same, p_diff = DegreeOfDifferenceTest.probabilities(np.tile(TAU, (5, 1)), d_true)
+    same = np.array([rng.multinomial(2000, p) for p in p_same])
+    different = np.array([rng.multinomial(2000, p) for p in p_diff])
+
+    test = DegreeOfDifferenceTest()
+    results = test.fit_many(same, different)
+    for result, d in zip(results, d_true, strict=True):
+        assert result.d_prime.lower < d < result.d_prime.upper
+        assert result.d_prime.estimate == pytest.approx(d, abs=4 * result.d_prime.stderr)
+        np.testing.assert_allclose(result.tau, TAU, atol=0.15)
+        assert result.p_value < 0.05
+
+    single = test.fit(same[2], different[2])
+    assert single.d_prime.estimate == pytest.approx(results[2].d_prime.estimate, abs=1e-4)
+    assert single.d_prime.upper == pytest.approx(results[2].d_prime.upper, abs=1e-4)
+
+
+def test_no_difference() -> None:
+    """Identical rating distributions give δ close to zero and no significance."""
+    result = DegreeOfDifferenceTest().fit([30, 25, 15, 10], [30, 25, 15, 10])
+    assert result.d_prime.estimate < 0.5
+    assert result.d_prime.lower == 0
+    assert result.p_value > 0.05
+
+
+def test_invalid_counts() -> None:
+    """Mismatched count arrays are rejected."""
+    with pytest.raises(ValueError, match="must share a shape"):
+        DegreeOfDifferenceTest().fit([1, 2, 3], [1, 2])
@@ -0,0 +1,69 @@
+"""Tests for the double discrimination methods."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from sensopy.discrimination import (
+    DOUBLE_TRIANGLE,
+    DOUBLE_TWO_AFC,
+    TRIANGLE,
+    TWO_AFC,
+    DiscriminationTest,
+    DoubleDiscriminationTest,
+)
+
+
+def test_psychometric_function() -> None:
+    """P_c and the table are the squares of the base method's."""
+    assert DOUBLE_TRIANGLE.guessing == pytest.approx(1 / 9)
+    assert DOUBLE_TWO_AFC.psychometric_function(1.0) == pytest.approx(
+        TWO_AFC.psychometric_function(1.0) ** 2
+    )
+    assert DOUBLE_TRIANGLE.evaluate(1.5)[0] == pytest.approx(TRIANGLE.evaluate(1.5)[0] ** 2)
+
+    d = np.array([0.5, 1.0, 2.0])
+    np.testing.assert_allclose(
+        DOUBLE_TRIANGLE.table.psychometric_function(d), TRIANGLE.table.psychometric_function(d) ** 2
+    )
+    np.testing.assert_allclose(
+        DOUBLE_TRIANGLE.table.derivative(d),
+        2 * TRIANGLE.table.psychometric_function(d) * TRIANGLE.table.derivative(d),
+    )
+    result = DiscriminationTest(DOUBLE_TRIANGLE).difference(40, 100)
+    assert DOUBLE_TRIANGLE.psychometric_function(result.d_prime.estimate) == pytest.approx(0.4)
+
+
+def test_multinomial() -> None:
+    """Batch estimation from 0/1/2-correct counts matches the closed form."""
+    counts = np.array([[30, 40, 30], [45, 45, 10], [5, 30, 65]])
+    test = DoubleDiscriminationTest(DOUBLE_TRIANGLE)
+    results = test.fit_many(counts)
+
+    pc = (counts[:, 1] + 2 * counts[:, 2]) / 200
+    for result, expected in zip(results, pc, strict=True):
+        assert result.pc.estimate == pytest.approx(expected)
+        assert expected < result.pc.upper
+        assert result.d_prime.lower <= result.d_prime.estimate < result.d_prime.upper
+
+    assert results[0].d_prime.estimate == pytest.approx(TRIANGLE.d_prime(0.5)[0], abs=1e-6)
+    assert results[1].d_prime.estimate == 0
+    assert results[1].p_value == 1
+    assert results[2].p_value < 1e-10
+    assert test.fit(counts[2]).d_prime.upper == pytest.approx(results[2].d_prime.upper)
+
+    with pytest.raises(ValueError, match="three columns"):
+        test.fit([1, 2])
+
+
+def test_below_chance() -> None:
+    """Below chance d' is clamped to zero with an infinite, never negative, SE."""
+    d_prime = DiscriminationTest(DOUBLE_TRIANGLE).difference(3, 30).d_prime
+    assert (d_prime.estimate, d_prime.lower) == (0, 0)
+    assert d_prime.stderr == np.inf
+
+    result = DoubleDiscriminationTest(DOUBLE_TRIANGLE).fit([20, 8, 2])
+    assert (result.d_prime.estimate, result.d_prime.lower) == (0, 0)
+    assert result.d_prime.stderr == np.inf
+    assert result.p_value == pytest.approx(1.0)
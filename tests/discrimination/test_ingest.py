@@ -0,0 +1,140 @@
+"""Tests for the ingestion of trial-level logs."""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from sensopy.discrimination import (
+    TRIANGLE,
+    DiscriminationTest,
+    TrialCounter,
+    TrialCounts,
+    count_trials,
+    get_method,
+    ingest,
+    read_chunks,
+)
+from sensopy.discrimination.ingest import JSONL_SUFFIXES
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sensopy.discrimination.methods import DiscriminationMethod
+
+ROWS = [
+    ("p1", "triangle", "s1", "1"),
+    ("p1", "triangle", "s1", "0"),
+    ("p1", "triangle", "s2", "true"),
+    ("p2", "triangle", "s1", "0"),
+    ("p2", "triangle", "s2", "1"),
+    ("p2", "duo_trio", "s1", "yes"),
+    ("p2", "duo_trio", "s2", "1"),
+    ("p2", "duo_trio", "s2", "no"),
+]
+"""Trials with hand-counted totals: p1/triangle 2 of 3, p2/triangle 1 of 2,
+p2/duo_trio 2 of 3; session s1 2 of 4, s2 3 of 4."""
+
+
+def _write_csv(path: Path) -> None:
+    lines = ["panelist,product,method,session,correct"]
+    lines += [f"{i},{','.join(row)}" for i, row in enumerate(ROWS)]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_get_method() -> None:
+    """Methods are looked up by name, including M + N designs."""
+    assert get_method("Triangle") is TRIANGLE
+    assert get_method("double_two_afc").guessing == pytest.approx(0.25)
+    assert get_method("mplusn_3_3_unspecified") is get_method("mplusn_3_3_unspecified")
+    with pytest.raises(ValueError, match="Unknown"):
+        get_method("pentad")
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_count_csv(tmp_path: Path, use_mmap: bool) -> None:
+    """CSV logs are counted in chunks to the hand-counted totals."""
+    path = tmp_path / "trials.csv"
+    _write_csv(path)
+    counts = count_trials(path, chunk_size=2, use_mmap=use_mmap)
+    assert counts.keys == [("p1", "triangle"), ("p2", "duo_trio"), ("p2", "triangle")]
+    np.testing.assert_array_equal(counts.x, [2, 2, 1])
+    np.testing.assert_array_equal(counts.n, [3, 3, 2])
+
+    results = counts.difference()
+    assert results[0].p_value == pytest.approx(
+        DiscriminationTest(TRIANGLE).difference(2, 3).p_value
+    )
+
+
+def test_csv_blank_and_short_rows() -> None:
+    """Blank lines are skipped and short rows are reported by line number."""
+    text = "product,method,correct\np1,triangle,1\n\np1,triangle,0\n\n"
+    counts = count_trials(io.StringIO(text))
+    np.testing.assert_array_equal(counts.x, [1])
+    np.testing.assert_array_equal(counts.n, [2])
+
+    with pytest.raises(ValueError, match="Line 3"):
+        count_trials(io.StringIO("product,method,correct\np1,triangle,1\np1,triangle\n"))
+
+
+def test_count_jsonl(tmp_path: Path) -> None:
+    """JSON lines are counted with arbitrary grouping columns."""
+    path = tmp_path / "trials.jsonl"
+    records = [
+        {"product": p, "method": m, "session": s, "correct": c in {"1", "true", "yes"}}
+        for p, m, s, c in ROWS
+    ]
+    path.write_text("\n".join(json.dumps(record) for record in records))
+    counts = count_trials(path, by=("session",), chunk_size=3)
+    assert counts.keys == [("s1",), ("s2",)]
+    np.testing.assert_array_equal(counts.x, [2, 3])
+    np.testing.assert_array_equal(counts.n, [4, 4])
+    with pytest.raises(ValueError, match="Pass a method"):
+        counts.difference()
+    assert len(counts.difference(TRIANGLE)) == 2
+
+
+def test_difference_with_method(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An explicit method is shared by all groups through a single test."""
+    created = []
+
+    def spy(method: DiscriminationMethod) -> DiscriminationTest:
+        created.append(method)
+        return DiscriminationTest(method)
+
+    monkeypatch.setattr(ingest, "DiscriminationTest", spy)
+    counts = TrialCounts(("product",), [("a",), ("b",), ("c",)], np.array([5, 6, 7]), np.full(3, 9))
+    results = counts.difference(TRIANGLE)
+    assert created == [TRIANGLE]
+    assert [result.pc.estimate for result in results] == pytest.approx([5 / 9, 6 / 9, 7 / 9])
+
+
+def test_json_suffix_is_not_jsonl(tmp_path: Path) -> None:
+    """Only JSON-lines suffixes are read as JSON lines by default."""
+    assert ".json" not in JSONL_SUFFIXES
+    path = tmp_path / "trials.json"
+    path.write_text("product,method,correct\na,triangle,1\n")
+    assert count_trials(path).n.tolist() == [1]
+
+
+def test_merge_and_stream() -> None:
+    """Counters merge and read from open text streams."""
+    stream = io.StringIO("product,method,correct\na,triangle,1\nb,triangle,0\na,triangle,1\n")
+    chunks = list(read_chunks(stream, chunk_size=2))
+    assert [len(chunk["product"]) for chunk in chunks] == [2, 1]
+
+    first = TrialCounter().update(chunks[0])
+    second = TrialCounter().update(chunks[1])
+    counts = first.merge(second).counts()
+    np.testing.assert_array_equal(counts.x, [2, 0])
+    np.testing.assert_array_equal(counts.n, [2, 1])
+
+    with pytest.raises(ValueError, match="Missing columns: correct"):
+        TrialCounter().update({"product": ["a"], "method": ["triangle"]})
+    with pytest.raises(ValueError, match="different grouping"):
+        first.merge(TrialCounter(by=("product",)))
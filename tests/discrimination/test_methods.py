@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
-from sensopy.discrimination.methods import DiscriminationMethod
-from sensopy.discrimination.mplusn import mplusn_mc
+from sensopy.discrimination import THREE_AFC, MPlusNMethod
+from sensopy.discrimination.methods import (
+    DEFAULT_TOLERANCE,
+    DiscriminationMethod,
+    get_tolerance,
+    set_tolerance,
+)
+from sensopy.discrimination.mplusn import (
+    BATCH_SIZE,
+    mplusn_curve,
+    mplusn_mc,
+    mplusn_p_value,
+    mplusn_single_set,
+)
 
 
 def test_abstract_psychometric_function() -> None:
@@ -53,3 +66,62 @@ def test_invalid_m_plus_n() -> None:
         match=r"Invalid combination of parameters. M >= N expected.",
     ):
         mplusn_mc(1, 3)
+
+
+def test_mplusn_single_set() -> None:
+    """Hypergeometric p-values of a perfect sorting equal the guessing probability."""
+    m = np.array([3, 4, 4, 5])
+    n = np.array([3, 3, 4, 5])
+    specified = np.array([False, True, False, True])
+    guessing = [MPlusNMethod(3, 3).guessing, MPlusNMethod(4, 3, specified=True).guessing]
+    np.testing.assert_allclose(mplusn_p_value(m, n, n, specified)[:2], guessing)
+
+    p_value, critical = mplusn_single_set(m, n, specified)
+    assert p_value.shape == (4, 6)
+    np.testing.assert_allclose(p_value[:, 0], 1.0)
+    np.testing.assert_allclose(p_value[2, 3:5], [2 * 17 / 70, 2 / 70])
+    np.testing.assert_array_equal(critical, [4, 3, 4, 5])
+
+    with pytest.raises(ValueError, match="M >= N expected"):
+        mplusn_p_value(2, 3, 2)
+
+
+def test_tolerance() -> None:
+    """A looser tolerance gives a cheaper estimate whose error estimate reflects it."""
+    precise, precise_error = THREE_AFC.evaluate(1.0)
+    rough, rough_error = THREE_AFC.evaluate(1.0, tol=1e-3)
+    assert precise_error <= get_tolerance()
+    assert abs(rough - precise) <= max(rough_error, 1e-3)
+
+    d, d_error = THREE_AFC.d_prime(0.63)
+    assert d == pytest.approx(0.9872, abs=1e-3)
+    assert d_error < 1e-6
+    assert THREE_AFC.d_prime(0.63, tol=1e-3)[1] > d_error
+    assert THREE_AFC.d_prime(1 / 4) == (0.0, 0.0)
+
+    set_tolerance(1e-3)
+    try:
+        assert get_tolerance() == pytest.approx(1e-3)
+        assert THREE_AFC.evaluate(1.0) == (rough, rough_error)
+    finally:
+        set_tolerance(None)
+    assert get_tolerance() == DEFAULT_TOLERANCE
+
+    with pytest.raises(ValueError, match="must be positive"):
+        set_tolerance(0)
+
+
+def test_mplusn_adaptive_replicates() -> None:
+    """Monte Carlo replicates stop once the target standard error is reached."""
+    _, _, stderr = mplusn_curve(2, 2, steps=5, seed=0, tol=0.01)
+    assert np.all(stderr <= 0.01)
+
+    _, _, full = mplusn_curve(2, 2, steps=5, seed=0, sample_size=10 * BATCH_SIZE)
+    assert np.all(full <= stderr)
+
+
+def test_mplusn_saturated_stderr() -> None:
+    """The standard error stays positive when every replicate is a hit."""
+    _, pc, stderr = mplusn_curve(2, 2, max_delta=20, steps=2, seed=0, tol=1e-4)
+    assert pc[-1] == pytest.approx(1.0)
+    assert stderr[-1] > 0
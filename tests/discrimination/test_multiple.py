@@ -0,0 +1,55 @@
+"""Tests for multiple-sample discrimination tests."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy.stats import binom, chi2_contingency
+
+from sensopy.discrimination import TRIANGLE, DiscriminationTest, MultipleSampleTest, holm
+
+
+def test_holm() -> None:
+    """Holm adjustment matches the step-down definition."""
+    np.testing.assert_allclose(holm([0.01, 0.04, 0.03, 0.2]), [0.04, 0.09, 0.09, 0.2])
+
+
+def test_analyze() -> None:
+    """Vectorized results agree with per-sample tests and the contingency test."""
+    x = np.array([30, 48, 60, 41])
+    n = np.array([100, 100, 100, 90])
+    result = MultipleSampleTest(TRIANGLE).analyze(x, n)
+
+    test = DiscriminationTest(TRIANGLE)
+    assert result.d_prime[0] == 0
+    assert result.p_value[0] == pytest.approx(binom.sf(29, 100, 1 / 3))
+    for i in range(1, len(x)):
+        single = test.difference(int(x[i]), int(n[i]))
+        assert result.p_value[i] == pytest.approx(single.p_value)
+        assert result.d_prime[i] == pytest.approx(single.d_prime.estimate)
+        assert result.d_prime_stderr[i] == pytest.approx(single.d_prime.stderr, rel=1e-4)
+        # Simultaneous limits are wider than the individual ones.
+        assert result.d_prime_upper[i] > single.d_prime.upper
+
+    assert np.all(result.adjusted_p_value >= result.p_value)
+    assert result.adjusted_p_value[2] < 0.05
+
+    table = np.stack([x, n - x], axis=1)
+    statistic, p_value, df, _ = chi2_contingency(table, correction=False)
+    assert result.homogeneity.statistic == pytest.approx(statistic)
+    assert result.homogeneity.p_value == pytest.approx(p_value)
+    assert result.homogeneity.df == df
+
+    with pytest.raises(ValueError, match="At least two"):
+        MultipleSampleTest(TRIANGLE).analyze([10], [20])
+
+
+def test_extreme_counts_match_single_tests() -> None:
+    """No and all correct responses give the same d' limits as single tests."""
+    result = MultipleSampleTest(TRIANGLE).analyze([0, 30], 30, conf_level=0.9)
+    for i, x in enumerate((0, 30)):
+        single = DiscriminationTest(TRIANGLE).difference(x, 30).d_prime
+        assert result.d_prime[i] == single.estimate
+        assert result.d_prime_lower[i] == pytest.approx(single.lower)
+        assert result.d_prime_upper[i] == pytest.approx(single.upper)
+    assert result.d_prime_upper[1] == np.inf
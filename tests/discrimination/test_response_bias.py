@@ -0,0 +1,80 @@
+"""Tests for the response-bias methods."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from sensopy.discrimination import A_NOT_A, A_NOT_AR, SAME_DIFFERENT, ResponseBiasMethod
+
+METHODS = [A_NOT_A, A_NOT_AR, SAME_DIFFERENT]
+
+
+def test_a_not_a() -> None:
+    """A-Not A gives d' = z(H) - z(F) and A-Not AR scales it by √2."""
+    result = A_NOT_A.estimate(70, 100, 30, 100)
+    expected = norm.ppf(0.7) - norm.ppf(0.3)
+    assert result.d_prime == pytest.approx(expected)
+    assert result.tau == pytest.approx(-norm.ppf(0.3))
+    assert result.lower < expected < result.upper
+    assert result.p_value < 0.001
+    assert A_NOT_AR.estimate(70, 100, 30, 100).d_prime == pytest.approx(np.sqrt(2) * expected)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_gradient(method: ResponseBiasMethod) -> None:
+    """The analytic derivatives match central finite differences."""
+    hit = np.array([0.55, 0.7, 0.9])
+    false_alarm = np.array([0.3, 0.4, 0.2])
+    grad_hit, grad_false_alarm = method.gradient(hit, false_alarm)
+
+    h = 1e-6
+    numeric_hit = (
+        method.d_prime(hit + h, false_alarm)[0] - method.d_prime(hit - h, false_alarm)[0]
+    ) / (2 * h)
+    numeric_false_alarm = (
+        method.d_prime(hit, false_alarm + h)[0] - method.d_prime(hit, false_alarm - h)[0]
+    ) / (2 * h)
+    np.testing.assert_allclose(grad_hit, numeric_hit, rtol=1e-5)
+    np.testing.assert_allclose(grad_false_alarm, numeric_false_alarm, rtol=1e-5)
+
+
+def test_same_different() -> None:
+    """Same-Different recovers δ from its model and truncates at zero."""
+    tau = 1.5
+    d = np.array([0.5, 1.5, 3.0])
+    false_alarm = 1 - (2 * norm.cdf(tau / np.sqrt(2)) - 1)
+    hit = 1 - (norm.cdf((tau - d) / np.sqrt(2)) - norm.cdf((-tau - d) / np.sqrt(2)))
+    estimate, estimated_tau = SAME_DIFFERENT.d_prime(hit, false_alarm)
+    np.testing.assert_allclose(estimate, d, rtol=1e-8)
+    np.testing.assert_allclose(estimated_tau, tau)
+
+    result = SAME_DIFFERENT.estimate(20, 100, 30, 100)
+    assert result.d_prime == 0
+    assert result.lower == 0
+    assert np.isnan(result.stderr)
+    assert 0 < result.upper < np.inf
+    assert result.p_value > 0.5
+
+
+def test_extreme_rates() -> None:
+    """Rates of 0 or 1 are corrected, so small panels give finite estimates."""
+    result = A_NOT_A.estimate(10, 10, 0, 10)
+    expected = norm.ppf(1 - 1 / 20) - norm.ppf(1 / 20)
+    assert result.d_prime == pytest.approx(expected)
+    assert all(math.isfinite(float(v)) for v in (result.stderr, result.lower, result.upper))
+    assert type(result.d_prime) is float
+    assert type(SAME_DIFFERENT.estimate(20, 20, 3, 20).d_prime) is float
+
+
+def test_vectorized() -> None:
+    """Many tables are analysed in one call with broadcasting."""
+    x_signal = np.array([[60, 70], [80, 90]])
+    result = A_NOT_A.estimate(x_signal, 100, 30, 100)
+    assert np.shape(result.d_prime) == (2, 2)
+    single = A_NOT_A.estimate(80, 100, 30, 100)
+    assert np.asarray(result.d_prime)[1, 0] == pytest.approx(single.d_prime)
+    assert np.asarray(result.stderr)[1, 0] == pytest.approx(single.stderr)
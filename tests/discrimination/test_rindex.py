@@ -0,0 +1,72 @@
+"""Tests for the R-index."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy.stats import mannwhitneyu
+
+from sensopy.discrimination import RIndexTest
+
+
+def test_matches_pairwise_comparison() -> None:
+    """Counts-based R equals the all-pairs definition and the Mann-Whitney test."""
+    rng = np.random.default_rng(1)
+    signal = rng.integers(0, 5, 60) + rng.integers(0, 2, 60)
+    noise = rng.integers(0, 5, 50)
+    diff = signal[:, None] - noise[None, :]
+    expected = np.mean(diff > 0) + np.mean(diff == 0) / 2
+
+    ratings = np.concatenate([signal, noise])
+    is_signal = np.arange(110) < 60
+    test = RIndexTest()
+    s, n = test.counts(ratings, is_signal, categories=6)
+    result = test.test(s[0], n[0])
+    assert result.r_index.estimate == pytest.approx(expected)
+    reference = mannwhitneyu(signal, noise, alternative="greater", method="asymptotic")
+    assert result.p_value == pytest.approx(reference.pvalue, rel=0.05)
+    assert result.r_index.lower < expected < result.r_index.upper
+
+
+def test_delong_stderr() -> None:
+    """The standard error matches a brute-force DeLong computation."""
+    signal_counts = np.array([1, 2, 5, 20, 30])
+    noise_counts = np.array([30, 20, 5, 2, 1])
+    signal = np.repeat(np.arange(5), signal_counts)
+    noise = np.repeat(np.arange(5), noise_counts)
+    kernel = (signal[:, None] > noise[None, :]) + (signal[:, None] == noise[None, :]) / 2
+    v_signal = kernel.mean(axis=1)
+    v_noise = kernel.mean(axis=0)
+    expected = np.sqrt(
+        np.var(v_signal, ddof=1) / signal.size + np.var(v_noise, ddof=1) / noise.size
+    )
+
+    result = RIndexTest().test(signal_counts, noise_counts)
+    assert result.r_index.estimate == pytest.approx(kernel.mean())
+    assert result.r_index.stderr == pytest.approx(expected)
+    assert result.r_index.stderr < 0.03
+
+
+def test_grouped() -> None:
+    """One grouped call matches per-product calls."""
+    rng = np.random.default_rng(2)
+    groups = rng.integers(0, 3, 3000)
+    is_signal = rng.random(3000) < 0.5
+    ratings = np.clip(rng.integers(0, 4, 3000) + is_signal * groups, 0, 4)
+    test = RIndexTest()
+    s, n = test.counts(ratings, is_signal, groups, categories=5)
+    assert s.shape == n.shape == (3, 5)
+    assert s.sum() + n.sum() == 3000
+
+    results = test.test_many(s, n)
+    np.testing.assert_allclose([r.r_index.estimate for r in results], test.r_index(s, n))
+    single = test.test(s[1], n[1])
+    assert single.r_index.stderr == pytest.approx(results[1].r_index.stderr)
+    assert results[0].p_value > 0.01
+    assert results[2].p_value < 1e-6
+
+
+def test_invalid_ratings() -> None:
+    """Ratings outside the category range are rejected."""
+    with pytest.raises(ValueError, match="categories"):
+        RIndexTest.counts([0, 3], [True, False], categories=3)
@@ -0,0 +1,72 @@
+"""Tests for ROC analysis."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from sensopy.discrimination import (
+    TWO_AFC,
+    RIndexTest,
+    ROCAccumulator,
+    auc_to_d_prime,
+    d_prime_to_auc,
+)
+
+
+def test_d_prime_mapping() -> None:
+    """AUC and d' are linked by the 2-AFC psychometric function."""
+    d = auc_to_d_prime(0.8)
+    assert TWO_AFC.psychometric_function(float(d)) == pytest.approx(0.8)
+    assert d_prime_to_auc(d) == pytest.approx(0.8)
+    assert auc_to_d_prime(0.5) == 0
+
+
+def test_streaming_and_merge() -> None:
+    """Chunked, sharded accumulation matches a single pass over all responses."""
+    rng = np.random.default_rng(3)
+    signal = rng.random(20000) < 0.5
+    latent = rng.normal(signal * 1.0, 1.0)
+    ratings = np.digitize(latent, [-1.0, -0.3, 0.3, 1.0, 1.7])
+
+    shards = [ROCAccumulator(6) for _ in range(3)]
+    for i, (r, s) in enumerate(
+        zip(np.array_split(ratings, 10), np.array_split(signal, 10), strict=True)
+    ):
+        shards[i % 3].update(r, s)
+    merged = shards[0].merge(*shards[1:])
+    assert merged.count == 20000
+
+    full = ROCAccumulator(6).update(ratings, signal)
+    np.testing.assert_array_equal(merged.signal, full.signal)
+
+    false_alarm, hit = merged.roc()
+    assert false_alarm[0] == hit[0] == 0
+    assert false_alarm[-1] == hit[-1] == 1
+    trapezoid = np.sum(np.diff(false_alarm) * (hit[1:] + hit[:-1]) / 2)
+    assert merged.auc() == pytest.approx(trapezoid)
+    signal_counts, noise_counts = RIndexTest.counts(ratings, signal, categories=6)
+    assert merged.auc() == pytest.approx(RIndexTest.r_index(signal_counts[0], noise_counts[0]))
+
+    result = merged.result()
+    assert result.d_prime.lower < 1.0 < result.d_prime.upper
+    assert result.auc.lower < d_prime_to_auc(1.0) < result.auc.upper
+    assert result.p_value < 1e-10
+
+    # Standard errors follow the DeLong standard error of the R-index.
+    reference = RIndexTest().test(signal_counts[0], noise_counts[0])
+    assert result.auc.stderr == pytest.approx(reference.r_index.stderr)
+    h = 1e-6
+    slope = (auc_to_d_prime(result.auc.estimate + h) - auc_to_d_prime(result.auc.estimate - h)) / (
+        2 * h
+    )
+    assert result.d_prime.stderr == pytest.approx(slope * result.auc.stderr, rel=1e-5)
+    assert result.d_prime.upper - result.d_prime.lower == pytest.approx(
+        2 * 1.96 * result.d_prime.stderr, rel=0.05
+    )
+
+
+def test_merge_mismatch() -> None:
+    """Accumulators with different categories cannot be merged."""
+    with pytest.raises(ValueError, match="different categories"):
+        ROCAccumulator(4).merge(ROCAccumulator(5))
@@ -0,0 +1,139 @@
+"""Tests for the precomputed psychometric tables."""
+
+from __future__ import annotations
+
+import zipfile
+from itertools import starmap
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from sensopy.discrimination import THREE_AFC, TWO_AFC, MPlusNMethod, MultipleAFCMethod, tables
+from sensopy.discrimination.methods import BUILTIN_METHODS, MPLUSN_DESIGNS
+from sensopy.discrimination.mplusn import mplusn_curve
+from sensopy.discrimination.tablegen import build
+from sensopy.discrimination.tables import D_MAX, DATA_DIR, PsychometricTable
+
+if TYPE_CHECKING:
+    from sensopy.discrimination.methods import DiscriminationMethod
+
+
+@pytest.mark.parametrize("method", BUILTIN_METHODS, ids=lambda m: m.table_name)
+def test_shipped_table_matches_integration(method: DiscriminationMethod) -> None:
+    """Shipped tables agree with direct integration of the psychometric function."""
+    table = method.table
+    assert isinstance(table.pc, np.memmap)
+
+    d = np.random.default_rng(0).uniform(0, D_MAX, 50)
+    pc = np.array([method.psychometric_function(x) for x in d])
+    h = 1e-5
+    der = np.array([
+        (method.psychometric_function(x + h) - method.psychometric_function(x - h)) / (2 * h)
+        for x in d
+    ])
+
+    np.testing.assert_allclose(table.psychometric_function(d), pc, rtol=0, atol=1e-8)
+    np.testing.assert_allclose(table.derivative(d), der, rtol=0, atol=1e-5)
+
+    inside = (pc > method.guessing + 1e-6) & (pc < 1 - 1e-6)
+    np.testing.assert_allclose(table.d_prime(pc[inside]), d[inside], rtol=0, atol=1e-4)
+
+
+@pytest.mark.parametrize("method", BUILTIN_METHODS, ids=lambda m: m.table_name)
+def test_inverse_near_zero(method: DiscriminationMethod) -> None:
+    """The inverse stays accurate for small d', where many methods are flat."""
+    d = np.array([1e-4, 1e-3, 3e-3, 5e-3, 9e-3])
+    pc = np.array([method.psychometric_function(x) for x in d])
+    np.testing.assert_allclose(method.table.d_prime(pc), d, rtol=0, atol=1e-6)
+    assert method.table.d_prime(method.table.pc[0]) == 0
+
+
+@pytest.mark.parametrize(
+    ("m", "n", "specified"),
+    MPLUSN_DESIGNS,
+    ids=lambda value: str(value),
+)
+def test_shipped_mplusn_table(m: int, n: int, specified: bool) -> None:
+    """Shipped M + N tables agree with a fresh simulation within Monte Carlo error."""
+    method = MPlusNMethod(m, n, specified)
+    assert isinstance(method.table.pc, np.memmap)
+
+    d, pc, stderr = mplusn_curve(m, n, specified, steps=6, seed=1, sample_size=20_000)
+    bound = 5 * (stderr + np.interp(d, method.table.d, method.table.error)) + 1e-3
+    assert np.all(np.abs(method.table.psychometric_function(d) - pc) <= bound)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [str(method.table_name) for method in BUILTIN_METHODS]
+    + list(starmap(MPlusNMethod.design_name, MPLUSN_DESIGNS)),
+)
+def test_shipped_table_is_monotone(name: str) -> None:
+    """Shipped tables are non-decreasing in P_c, as the inverse function requires."""
+    table = PsychometricTable.load(name)
+    assert table is not None
+    assert np.all(np.diff(table.pc) >= 0)
+    assert np.all(table.dpc >= 0)
+
+
+def test_from_curve_is_monotone() -> None:
+    """Sampled curves are made non-decreasing."""
+    d = np.linspace(0, 1, 5)
+    table = PsychometricTable.from_curve(d, np.array([0.5, 0.7, 0.69, 0.9, 0.89]), np.zeros(5))
+    np.testing.assert_array_equal(table.pc, [0.5, 0.7, 0.7, 0.9, 0.9])
+    assert np.all(table.dpc >= 0)
+
+
+def test_guessing_probability_on_table() -> None:
+    """P_c within rounding of the table ends is clamped onto the table."""
+    for method in BUILTIN_METHODS:
+        assert method.table.d_prime(method.guessing) == 0
+
+
+def test_integration_far_from_zero() -> None:
+    """Integrals stay accurate for large d' and are NaN for an undefined d'."""
+    assert THREE_AFC.evaluate(40.0)[0] == pytest.approx(1.0)
+    assert THREE_AFC.evaluate(np.inf)[0] == pytest.approx(1.0)
+    assert np.isnan(THREE_AFC.evaluate(np.nan)[0])
+
+
+def test_load_from_archive(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tables inside a zipped install are read into memory."""
+    archive = tmp_path / "data.zip"
+    source = Path(tables.__file__).parent / DATA_DIR / "two_afc.npy"
+    with zipfile.ZipFile(archive, "w") as file:
+        file.write(source, f"{DATA_DIR}/two_afc.npy")
+    monkeypatch.setattr(tables, "files", lambda _: zipfile.Path(archive))
+    tables._load.cache_clear()
+    try:
+        table = PsychometricTable.load("two_afc")
+    finally:
+        tables._load.cache_clear()
+    assert table is not None
+    assert not isinstance(table.pc, np.memmap)
+    np.testing.assert_array_equal(table.pc, TWO_AFC.table.pc)
+
+
+def test_table_outside_range() -> None:
+    """Inputs outside the tabulated range yield NaN."""
+    table = THREE_AFC.table
+    assert np.isnan(table.psychometric_function([-1.0, D_MAX + 1, np.nan])).all()
+    assert np.isnan(table.derivative(D_MAX + 1))
+    assert np.isnan(table.d_prime([0.1, 1.0])).all()
+
+
+def test_computed_table() -> None:
+    """Methods without a shipped table are tabulated on first access."""
+    method = MultipleAFCMethod(3)
+    assert method.table_name is None
+    assert method.table is method.table
+    np.testing.assert_allclose(method.table.pc, THREE_AFC.table.pc, atol=1e-9)
+
+
+def test_build(tmp_path: Path) -> None:
+    """The generator reproduces the shipped tables."""
+    (path,) = build(tmp_path, ["three_afc"])
+    table = PsychometricTable.from_array(np.load(path))
+    np.testing.assert_allclose(table.to_array(), THREE_AFC.table.to_array(), atol=1e-12)
@@ -0,0 +1,93 @@
+"""Tests for the command-line batch evaluator."""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from sensopy.cli import evaluate, main, read_specs, run
+from sensopy.discrimination import TRIANGLE, DiscriminationTest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SPECS = [
+    {"method": "triangle", "x": 25, "n": 50},
+    {"method": "duo_trio", "x": 30, "n": 40, "test": "equivalence", "pd0": 0.3},
+    {"method": "pentad", "x": 1, "n": 2},
+    {"method": "triangle", "x": 25, "n": 50, "test": "tost"},
+]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run(workers: int) -> None:
+    """Results stream out in input order, with errors reported inline."""
+    output = io.StringIO()
+    run(SPECS, output, batch_size=1, workers=workers)
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert len(lines) == 4
+    expected = DiscriminationTest(TRIANGLE).difference(25, 50)
+    assert lines[0]["p_value"] == pytest.approx(expected.p_value)
+    assert lines[0]["d_prime"]["estimate"] == pytest.approx(expected.d_prime.estimate)
+    assert lines[1]["test"] == "equivalence"
+    assert "Unknown discrimination method" in lines[2]["error"]
+    assert "Unknown test" in lines[3]["error"]
+
+
+def test_main_csv(tmp_path: Path) -> None:
+    """CSV input files are read and results written to the output file."""
+    source = tmp_path / "specs.csv"
+    source.write_text("method,x,n,conf_level\ntriangle,25,50,0.9\ntwo_afc,35,50,\n")
+    target = tmp_path / "results.jsonl"
+    main([str(source), "--output", str(target)])
+
+    lines = [json.loads(line) for line in target.read_text().splitlines()]
+    assert [line["method"] for line in lines] == ["triangle", "two_afc"]
+    assert lines[0]["alpha"] == pytest.approx(0.1)
+    assert lines[1]["alpha"] == pytest.approx(0.05)
+
+
+def test_read_specs() -> None:
+    """JSON lines skip blank lines and report malformed lines inline."""
+    specs = list(read_specs(io.StringIO('{"method": "triangle"}\n\n{"x": 1}\n'), "jsonl"))
+    assert specs == [{"method": "triangle"}, {"x": 1}]
+
+    text = '{"method": "triangle", "x": 1, "n": 2}\n{"method": \n[1]\n'
+    specs = list(read_specs(io.StringIO(text), "jsonl"))
+    assert len(specs) == 3
+    assert specs[1]["line"] == 2
+    assert "Invalid JSON" in specs[1]["error"]
+    assert specs[2]["line"] == 3
+    assert evaluate(specs[1]) == specs[1]
+
+
+@pytest.mark.parametrize(
+    ("spec", "message"),
+    [
+        ({"x": 0, "n": 0}, "n must be positive"),
+        ({"x": 6, "n": 5}, "x must be between"),
+        ({"x": -1, "n": 5}, "x must be between"),
+        ({"x": 3, "n": 5, "conf_level": 0}, "conf_level"),
+        ({"x": 3, "n": 5, "conf_level": 1}, "conf_level"),
+        ({"x": 25.7, "n": 40}, "x must be a whole number"),
+        ({"x": "3", "n": "5.5"}, "n must be a whole number"),
+        ({"x": 3, "n": 5, "pd0": -0.1}, "pd0 must be in"),
+        ({"x": 3, "n": 5, "pd0": 1}, "pd0 must be in"),
+    ],
+)
+def test_evaluate_invalid(spec: dict[str, Any], message: str) -> None:
+    """Out-of-range counts and confidence levels are reported, not raised."""
+    result = evaluate({"method": "triangle", **spec})
+    assert message in result["error"]
+
+
+def test_evaluate_whole_floats() -> None:
+    """Counts written as whole floats, as some exporters do, are accepted."""
+    expected = evaluate({"method": "triangle", "x": 25, "n": 40})
+    for x, n in [(25.0, 40.0), ("25.0", "40")]:
+        result = evaluate({"method": "triangle", "x": x, "n": n})
+        assert result["p_value"] == expected["p_value"]